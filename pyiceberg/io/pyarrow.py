@@ -902,6 +902,24 @@ def schema_to_pyarrow(
     return visit(schema, _ConvertToArrowSchema(metadata, include_field_ids))
 
 
+# The Arrow types of the primitive types without parameters, constructed once instead of for every field
+_ARROW_BOOL = pa.bool_()
+_ARROW_INT32 = pa.int32()
+_ARROW_INT64 = pa.int64()
+_ARROW_FLOAT32 = pa.float32()
+_ARROW_FLOAT64 = pa.float64()
+_ARROW_DATE32 = pa.date32()
+_ARROW_TIME_US = pa.time64("us")
+_ARROW_TIMESTAMP_US = pa.timestamp(unit="us")
+_ARROW_TIMESTAMP_NS = pa.timestamp(unit="ns")
+_ARROW_TIMESTAMPTZ_US = pa.timestamp(unit="us", tz="UTC")
+_ARROW_TIMESTAMPTZ_NS = pa.timestamp(unit="ns", tz="UTC")
+_ARROW_LARGE_STRING = pa.large_string()
+_ARROW_UUID = pa.binary(16)
+_ARROW_NULL = pa.null()
+_ARROW_LARGE_BINARY = pa.large_binary()
+
+
 class _ConvertToArrowSchema(SchemaVisitorPerPrimitiveType[pa.DataType]):
     _metadata: Dict[bytes, bytes]
 
@@ -951,52 +969,52 @@ class _ConvertToArrowSchema(SchemaVisitorPerPrimitiveType[pa.DataType]):
         return pa.decimal128(decimal_type.precision, decimal_type.scale)
 
     def visit_boolean(self, _: BooleanType) -> pa.DataType:
-        return pa.bool_()
+        return _ARROW_BOOL
 
     def visit_integer(self, _: IntegerType) -> pa.DataType:
-        return pa.int32()
+        return _ARROW_INT32
 
     def visit_long(self, _: LongType) -> pa.DataType:
-        return pa.int64()
+        return _ARROW_INT64
 
     def visit_float(self, _: FloatType) -> pa.DataType:
         # 32-bit IEEE 754 floating point
-        return pa.float32()
+        return _ARROW_FLOAT32
 
     def visit_double(self, _: DoubleType) -> pa.DataType:
         # 64-bit IEEE 754 floating point
-        return pa.float64()
+        return _ARROW_FLOAT64
 
     def visit_date(self, _: DateType) -> pa.DataType:
         # Date encoded as an int
-        return pa.date32()
+        return _ARROW_DATE32
 
     def visit_time(self, _: TimeType) -> pa.DataType:
-        return pa.time64("us")
+        return _ARROW_TIME_US
 
     def visit_timestamp(self, _: TimestampType) -> pa.DataType:
-        return pa.timestamp(unit="us")
+        return _ARROW_TIMESTAMP_US
 
     def visit_timestamp_ns(self, _: TimestampNanoType) -> pa.DataType:
-        return pa.timestamp(unit="ns")
+        return _ARROW_TIMESTAMP_NS
 
     def visit_timestamptz(self, _: TimestamptzType) -> pa.DataType:
-        return pa.timestamp(unit="us", tz="UTC")
+        return _ARROW_TIMESTAMPTZ_US
 
     def visit_timestamptz_ns(self, _: TimestamptzNanoType) -> pa.DataType:
-        return pa.timestamp(unit="ns", tz="UTC")
+        return _ARROW_TIMESTAMPTZ_NS
 
     def visit_string(self, _: StringType) -> pa.DataType:
-        return pa.large_string()
+        return _ARROW_LARGE_STRING
 
     def visit_uuid(self, _: UUIDType) -> pa.DataType:
-        return pa.binary(16)
+        return _ARROW_UUID
 
     def visit_unknown(self, _: UnknownType) -> pa.DataType:
-        return pa.null()
+        return _ARROW_NULL
 
     def visit_binary(self, _: BinaryType) -> pa.DataType:
-        return pa.large_binary()
+        return _ARROW_LARGE_BINARY
 
 
 def _convert_scalar(value: Any, iceberg_type: IcebergType) -> pa.scalar:
@@ -2832,7 +2850,7 @@ def _check_pyarrow_schema_compatible(
         )
     except ValueError as e:
         provided_schema = _pyarrow_to_schema_without_ids(provided_schema, downcast_ns_timestamp_to_us=downcast_ns_timestamp_to_us)
-        additional_names = set(provided_schema._name_to_id.keys()) - set(requested_schema._name_to_id.keys())
+        additional_names = set(provided_schema._lazy_name_to_id.keys()) - set(requested_schema._lazy_name_to_id.keys())
         raise ValueError(
             f"PyArrow table contains more columns: {', '.join(sorted(additional_names))}. Update the schema first (hint, use union_by_name)."
         ) from e
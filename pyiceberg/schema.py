@@ -18,15 +18,17 @@
 from __future__ import annotations
 
 import itertools
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from functools import cached_property, partial, singledispatch
+from functools import cache, cached_property, partial, singledispatch
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
     Generic,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -36,7 +38,7 @@ from typing import (
     Union,
 )
 
-from pydantic import Field, PrivateAttr, model_validator
+from pydantic import Field, model_validator
 
 from pyiceberg.exceptions import ResolveError
 from pyiceberg.typedef import EMPTY_DICT, IcebergBaseModel, StructProtocol
@@ -78,6 +80,9 @@ P = TypeVar("P")
 
 INITIAL_SCHEMA_ID = 0
 
+# The number of selections that a schema keeps, before the cache is cleared
+_SELECTIONS_CACHE_SIZE = 128
+
 
 class Schema(IcebergBaseModel):
     """A table Schema.
@@ -92,13 +97,27 @@ class Schema(IcebergBaseModel):
     schema_id: int = Field(alias="schema-id", default=INITIAL_SCHEMA_ID)
     identifier_field_ids: List[int] = Field(alias="identifier-field-ids", default_factory=list)
 
-    _name_to_id: Dict[str, int] = PrivateAttr()
-
     def __init__(self, *fields: NestedField, **data: Any):
         if fields:
             data["fields"] = fields
         super().__init__(**data)
-        self._name_to_id = index_by_name(self)
+        # Index the full names right away, which also checks that the names are unique
+        self._lazy_full_name_to_id  # noqa: B018
+
+    def model_dump_json(
+        self, exclude_none: bool = True, exclude: Optional[Set[str]] = None, by_alias: bool = True, **kwargs: Any
+    ) -> str:
+        """Serialize the schema to JSON.
+
+        The schema is immutable, so the JSON that is produced with the default arguments is cached on the schema.
+        """
+        if exclude_none is not True or exclude is not None or by_alias is not True or kwargs:
+            return super().model_dump_json(exclude_none=exclude_none, exclude=exclude, by_alias=by_alias, **kwargs)
+        return self._lazy_json
+
+    @cached_property
+    def _lazy_json(self) -> str:
+        return super().model_dump_json()
 
     def __str__(self) -> str:
         """Return the string representation of the Schema class."""
@@ -120,13 +139,11 @@ class Schema(IcebergBaseModel):
         if not isinstance(other, Schema):
             return False
 
-        if len(self.columns) != len(other.columns):
-            return False
-
-        identifier_field_ids_is_equal = self.identifier_field_ids == other.identifier_field_ids
-        schema_is_equal = all(lhs == rhs for lhs, rhs in zip(self.columns, other.columns))
+        if self is other:
+            return True
 
-        return identifier_field_ids_is_equal and schema_is_equal
+        # The structs compare their cached hashes before comparing the fields one by one
+        return self.identifier_field_ids == other.identifier_field_ids and self.as_struct() == other.as_struct()
 
     @model_validator(mode="after")
     def check_schema(self) -> Schema:
@@ -141,21 +158,61 @@ class Schema(IcebergBaseModel):
         """A tuple of the top-level fields."""
         return self.fields
 
+    @cached_property
+    def _lazy_full_name_to_id(self) -> Dict[str, int]:
+        """Return an index of full field names to field IDs.
+
+        This is calculated when the schema is created, which checks that the full names are unique.
+        """
+        return _index_full_names(self)
+
     @cached_property
     def _lazy_id_to_field(self) -> Dict[int, NestedField]:
         """Return an index of field ID to NestedField instance.
 
         This is calculated once when called for the first time. Subsequent calls to this method will use a cached index.
         """
-        return index_by_id(self)
+        return visit(self, _IndexById()) if self.fields else EMPTY_DICT
 
     @cached_property
     def _lazy_id_to_parent(self) -> Dict[int, int]:
         """Returns an index of field ID to parent field IDs.
 
         This is calculated once when called for the first time. Subsequent calls to this method will use a cached index.
+        The parents are read off the index of field IDs, which saves a second walk over the schema.
+        """
+        id_to_parent: Dict[int, int] = {}
+        for field_id, field in self._lazy_id_to_field.items():
+            field_type = field.field_type
+            type_class = type(field_type)
+            if type_class is StructType:
+                for child in field_type.fields:
+                    id_to_parent[child.field_id] = field_id
+            elif type_class is ListType:
+                id_to_parent[field_type.element_id] = field_id
+            elif type_class is MapType:
+                id_to_parent[field_type.key_id] = field_id
+                id_to_parent[field_type.value_id] = field_id
+        return id_to_parent if id_to_parent else EMPTY_DICT
+
+    @cached_property
+    def _lazy_name_to_id(self) -> Dict[str, int]:
+        """Return an index of full and short field names to field IDs.
+
+        This is calculated once when called for the first time. Subsequent calls to this method will use a cached index.
+        Only the full names are collected when the schema is created, the short names that omit the element or
+        value of a list or map of structs are added here, when a name is not found among the full names.
         """
-        return _index_parents(self)
+        return index_by_name(self.as_struct()) if self.fields else EMPTY_DICT
+
+    @cached_property
+    def _lazy_selections(self) -> Dict[Tuple[Tuple[str, ...], bool], Schema]:
+        """Return the schemas that were selected from this schema, keyed by the names and case sensitivity.
+
+        A table scan selects the same columns from the schema several times. The schema is immutable, so the
+        result of a selection is cached. The cache is cleared when it holds too many selections.
+        """
+        return {}
 
     @cached_property
     def _lazy_name_to_id_lower(self) -> Dict[str, int]:
@@ -163,15 +220,17 @@ class Schema(IcebergBaseModel):
 
         This is calculated once when called for the first time. Subsequent calls to this method will use a cached index.
         """
-        return {name.lower(): field_id for name, field_id in self._name_to_id.items()}
+        return {name.lower(): field_id for name, field_id in self._lazy_name_to_id.items()}
 
     @cached_property
     def _lazy_id_to_name(self) -> Dict[int, str]:
         """Return an index of field ID to full name.
 
         This is calculated once when called for the first time. Subsequent calls to this method will use a cached index.
+        It is the inverse of the full names that were collected when the schema was created, so the short
+        names are not included.
         """
-        return index_name_by_id(self)
+        return {field_id: name for name, field_id in self._lazy_full_name_to_id.items()}
 
     @cached_property
     def _lazy_id_to_accessor(self) -> Dict[int, Accessor]:
@@ -181,16 +240,32 @@ class Schema(IcebergBaseModel):
         """
         return build_position_accessors(self)
 
+    @cached_property
+    def _lazy_struct(self) -> StructType:
+        """Return the schema as a struct.
+
+        This is calculated once when called for the first time. Subsequent calls to this method will use a cached struct.
+        """
+        return StructType.model_construct(fields=self.fields)
+
     def as_struct(self) -> StructType:
         """Return the schema as a struct."""
-        return StructType(*self.fields)
+        return self._lazy_struct
 
-    def as_arrow(self) -> "pa.Schema":
-        """Return the schema as an Arrow schema."""
+    @cached_property
+    def _lazy_arrow(self) -> "pa.Schema":
+        """Return the schema as an Arrow schema.
+
+        This is calculated once when called for the first time. Subsequent calls to this method will use a cached schema.
+        """
         from pyiceberg.io.pyarrow import schema_to_pyarrow
 
         return schema_to_pyarrow(self)
 
+    def as_arrow(self) -> "pa.Schema":
+        """Return the schema as an Arrow schema."""
+        return self._lazy_arrow
+
     def find_field(self, name_or_id: Union[str, int], case_sensitive: bool = True) -> NestedField:
         """Find a field using a field name or field ID.
 
@@ -210,7 +285,9 @@ class Schema(IcebergBaseModel):
             return self._lazy_id_to_field[name_or_id]
 
         if case_sensitive:
-            field_id = self._name_to_id.get(name_or_id)
+            field_id = self._lazy_full_name_to_id.get(name_or_id)
+            if field_id is None:
+                field_id = self._lazy_name_to_id.get(name_or_id)
         else:
             field_id = self._lazy_name_to_id_lower.get(name_or_id.lower())
 
@@ -312,20 +389,27 @@ class Schema(IcebergBaseModel):
         Raises:
             ValueError: If a column is selected that doesn't exist.
         """
+        key = (names, case_sensitive)
+        if (selected := self._lazy_selections.get(key)) is not None:
+            return selected
+
         try:
             if case_sensitive:
-                ids = {self._name_to_id[name] for name in names}
+                ids = {self._lazy_name_to_id[name] for name in names}
             else:
                 ids = {self._lazy_name_to_id_lower[name.lower()] for name in names}
         except KeyError as e:
             raise ValueError(f"Could not find column: {e}") from e
 
-        return prune_columns(self, ids)
+        if len(self._lazy_selections) >= _SELECTIONS_CACHE_SIZE:
+            self._lazy_selections.clear()
+        selected = self._lazy_selections[key] = prune_columns(self, ids)
+        return selected
 
     @property
     def field_ids(self) -> Set[int]:
         """Return the IDs of the current schema."""
-        return set(self._name_to_id.values())
+        return set(self._lazy_full_name_to_id.values())
 
     def _validate_identifier_field(self, field_id: int) -> None:
         """Validate that the field with the given ID is a valid identifier field.
@@ -348,14 +432,15 @@ class Schema(IcebergBaseModel):
 
         # Check whether the nested field is in a chain of required struct fields
         # Exploring from root for better error message for list and map types
-        parent_id = self._lazy_id_to_parent.get(field.field_id)
+        id_to_parent = self._lazy_id_to_parent
+        parent_id = id_to_parent.get(field.field_id)
         fields: List[int] = []
         while parent_id is not None:
             fields.append(parent_id)
-            parent_id = self._lazy_id_to_parent.get(parent_id)
+            parent_id = id_to_parent.get(parent_id)
 
         while fields:
-            parent = self.find_field(fields.pop())
+            parent = self._lazy_id_to_field[fields.pop()]
             if not parent.field_type.is_struct:
                 raise ValueError(f"Cannot add field {field.name} as an identifier field: must not be nested in {parent}")
 
@@ -462,6 +547,37 @@ class PreOrderSchemaVisitor(Generic[T], ABC):
         """Visit a PrimitiveType."""
 
 
+# The visit method of the primitive visitors for each primitive type
+_PRIMITIVE_VISIT_METHODS: Dict[type, str] = {
+    BooleanType: "visit_boolean",
+    IntegerType: "visit_integer",
+    LongType: "visit_long",
+    FloatType: "visit_float",
+    DoubleType: "visit_double",
+    DecimalType: "visit_decimal",
+    DateType: "visit_date",
+    TimeType: "visit_time",
+    TimestampType: "visit_timestamp",
+    TimestampNanoType: "visit_timestamp_ns",
+    TimestamptzType: "visit_timestamptz",
+    TimestamptzNanoType: "visit_timestamptz_ns",
+    StringType: "visit_string",
+    UUIDType: "visit_uuid",
+    FixedType: "visit_fixed",
+    BinaryType: "visit_binary",
+    UnknownType: "visit_unknown",
+}
+
+
+def _primitive_visit_method(primitive: PrimitiveType) -> str:
+    """Look up the visit method of a subclass of one of the primitive types, and remember it for its type."""
+    for primitive_type, method in list(_PRIMITIVE_VISIT_METHODS.items()):
+        if isinstance(primitive, primitive_type):
+            _PRIMITIVE_VISIT_METHODS[type(primitive)] = method
+            return method
+    raise ValueError(f"Type not recognized: {primitive}")
+
+
 class SchemaWithPartnerVisitor(Generic[P, T], ABC):
     def before_field(self, field: NestedField, field_partner: Optional[P]) -> None:
         """Override this method to perform an action immediately before visiting a field."""
@@ -521,42 +637,8 @@ class SchemaWithPartnerVisitor(Generic[P, T], ABC):
 class PrimitiveWithPartnerVisitor(SchemaWithPartnerVisitor[P, T]):
     def primitive(self, primitive: PrimitiveType, primitive_partner: Optional[P]) -> T:
         """Visit a PrimitiveType."""
-        if isinstance(primitive, BooleanType):
-            return self.visit_boolean(primitive, primitive_partner)
-        elif isinstance(primitive, IntegerType):
-            return self.visit_integer(primitive, primitive_partner)
-        elif isinstance(primitive, LongType):
-            return self.visit_long(primitive, primitive_partner)
-        elif isinstance(primitive, FloatType):
-            return self.visit_float(primitive, primitive_partner)
-        elif isinstance(primitive, DoubleType):
-            return self.visit_double(primitive, primitive_partner)
-        elif isinstance(primitive, DecimalType):
-            return self.visit_decimal(primitive, primitive_partner)
-        elif isinstance(primitive, DateType):
-            return self.visit_date(primitive, primitive_partner)
-        elif isinstance(primitive, TimeType):
-            return self.visit_time(primitive, primitive_partner)
-        elif isinstance(primitive, TimestampType):
-            return self.visit_timestamp(primitive, primitive_partner)
-        elif isinstance(primitive, TimestampNanoType):
-            return self.visit_timestamp_ns(primitive, primitive_partner)
-        elif isinstance(primitive, TimestamptzType):
-            return self.visit_timestamptz(primitive, primitive_partner)
-        elif isinstance(primitive, TimestamptzNanoType):
-            return self.visit_timestamptz_ns(primitive, primitive_partner)
-        elif isinstance(primitive, StringType):
-            return self.visit_string(primitive, primitive_partner)
-        elif isinstance(primitive, UUIDType):
-            return self.visit_uuid(primitive, primitive_partner)
-        elif isinstance(primitive, FixedType):
-            return self.visit_fixed(primitive, primitive_partner)
-        elif isinstance(primitive, BinaryType):
-            return self.visit_binary(primitive, primitive_partner)
-        elif isinstance(primitive, UnknownType):
-            return self.visit_unknown(primitive, primitive_partner)
-        else:
-            raise ValueError(f"Type not recognized: {primitive}")
+        method = _PRIMITIVE_VISIT_METHODS.get(type(primitive)) or _primitive_visit_method(primitive)
+        return getattr(self, method)(primitive, primitive_partner)
 
     @abstractmethod
     def visit_boolean(self, boolean_type: BooleanType, partner: Optional[P]) -> T:
@@ -715,42 +797,8 @@ def _(primitive: PrimitiveType, partner: P, visitor: SchemaWithPartnerVisitor[P,
 class SchemaVisitorPerPrimitiveType(SchemaVisitor[T], ABC):
     def primitive(self, primitive: PrimitiveType) -> T:
         """Visit a PrimitiveType."""
-        if isinstance(primitive, FixedType):
-            return self.visit_fixed(primitive)
-        elif isinstance(primitive, DecimalType):
-            return self.visit_decimal(primitive)
-        elif isinstance(primitive, BooleanType):
-            return self.visit_boolean(primitive)
-        elif isinstance(primitive, IntegerType):
-            return self.visit_integer(primitive)
-        elif isinstance(primitive, LongType):
-            return self.visit_long(primitive)
-        elif isinstance(primitive, FloatType):
-            return self.visit_float(primitive)
-        elif isinstance(primitive, DoubleType):
-            return self.visit_double(primitive)
-        elif isinstance(primitive, DateType):
-            return self.visit_date(primitive)
-        elif isinstance(primitive, TimeType):
-            return self.visit_time(primitive)
-        elif isinstance(primitive, TimestampType):
-            return self.visit_timestamp(primitive)
-        elif isinstance(primitive, TimestampNanoType):
-            return self.visit_timestamp_ns(primitive)
-        elif isinstance(primitive, TimestamptzType):
-            return self.visit_timestamptz(primitive)
-        elif isinstance(primitive, TimestamptzNanoType):
-            return self.visit_timestamptz_ns(primitive)
-        elif isinstance(primitive, StringType):
-            return self.visit_string(primitive)
-        elif isinstance(primitive, UUIDType):
-            return self.visit_uuid(primitive)
-        elif isinstance(primitive, BinaryType):
-            return self.visit_binary(primitive)
-        elif isinstance(primitive, UnknownType):
-            return self.visit_unknown(primitive)
-        else:
-            raise ValueError(f"Type not recognized: {primitive}")
+        method = _PRIMITIVE_VISIT_METHODS.get(type(primitive)) or _primitive_visit_method(primitive)
+        return getattr(self, method)(primitive)
 
     @abstractmethod
     def visit_fixed(self, fixed_type: FixedType) -> T:
@@ -821,12 +869,23 @@ class SchemaVisitorPerPrimitiveType(SchemaVisitor[T], ABC):
         """Visit a UnknownType."""
 
 
-@dataclass(init=True, eq=True, frozen=True)
+@dataclass(init=False, eq=True, frozen=True)
 class Accessor:
     """An accessor for a specific position in a container that implements the StructProtocol."""
 
+    __slots__ = ("position", "inner")
+
     position: int
-    inner: Optional[Accessor] = None
+    inner: Optional[Accessor]
+
+    def __init__(self, position: int, inner: Optional[Accessor] = None) -> None:
+        # Slots cannot have a default in the class body, so the dataclass __init__ is not used
+        object.__setattr__(self, "position", position)
+        object.__setattr__(self, "inner", inner)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the Accessor by its arguments, since the frozen slots cannot be restored by setting them."""
+        return Accessor, (self.position, self.inner)
 
     def __str__(self) -> str:
         """Return the string representation of the Accessor class."""
@@ -874,51 +933,142 @@ def visit(obj: Union[Schema, IcebergType], visitor: SchemaVisitor[T]) -> T:
 @visit.register(Schema)
 def _(obj: Schema, visitor: SchemaVisitor[T]) -> T:
     """Visit a Schema with a concrete SchemaVisitor."""
-    return visitor.schema(obj, visit(obj.as_struct(), visitor))
+    return visitor.schema(obj, _walk(obj.as_struct(), visitor))
 
 
 @visit.register(StructType)
-def _(obj: StructType, visitor: SchemaVisitor[T]) -> T:
-    """Visit a StructType with a concrete SchemaVisitor."""
-    results = []
-
-    for field in obj.fields:
-        visitor.before_field(field)
-        result = visit(field.field_type, visitor)
-        visitor.after_field(field)
-        results.append(visitor.field(field, result))
-
-    return visitor.struct(obj, results)
-
-
 @visit.register(ListType)
-def _(obj: ListType, visitor: SchemaVisitor[T]) -> T:
-    """Visit a ListType with a concrete SchemaVisitor."""
-    visitor.before_list_element(obj.element_field)
-    result = visit(obj.element_type, visitor)
-    visitor.after_list_element(obj.element_field)
-
-    return visitor.list(obj, result)
+@visit.register(MapType)
+@visit.register(PrimitiveType)
+def _(obj: IcebergType, visitor: SchemaVisitor[T]) -> T:
+    """Visit an IcebergType with a concrete SchemaVisitor."""
+    return _walk(obj, visitor)
+
+
+# Steps that are scheduled on the stack of _walk
+_ENTER = 0
+_BEFORE_FIELD = 1
+_LEAVE_FIELD = 2
+_LEAVE_STRUCT = 3
+_BEFORE_LIST_ELEMENT = 4
+_LEAVE_LIST = 5
+_BEFORE_MAP_KEY = 6
+_AFTER_MAP_KEY = 7
+_BEFORE_MAP_VALUE = 8
+_AFTER_MAP_VALUE = 9
+_LEAVE_MAP = 10
+
+# The kind of node, looked up by the exact type to avoid the costly isinstance checks on every node
+_PRIMITIVE = 1
+_STRUCT = 2
+_LIST = 3
+_MAP = 4
+_NODE_KINDS: Dict[type, int] = {StructType: _STRUCT, ListType: _LIST, MapType: _MAP}
+
+
+def _node_kind(node: Any) -> int:
+    if isinstance(node, PrimitiveType):
+        kind = _PRIMITIVE
+    elif isinstance(node, StructType):
+        kind = _STRUCT
+    elif isinstance(node, ListType):
+        kind = _LIST
+    elif isinstance(node, MapType):
+        kind = _MAP
+    else:
+        raise NotImplementedError(f"Cannot visit non-type: {node}")
 
+    _NODE_KINDS[type(node)] = kind
+    return kind
 
-@visit.register(MapType)
-def _(obj: MapType, visitor: SchemaVisitor[T]) -> T:
-    """Visit a MapType with a concrete SchemaVisitor."""
-    visitor.before_map_key(obj.key_field)
-    key_result = visit(obj.key_type, visitor)
-    visitor.after_map_key(obj.key_field)
 
-    visitor.before_map_value(obj.value_field)
-    value_result = visit(obj.value_type, visitor)
-    visitor.after_map_value(obj.value_field)
+def _walk(obj: IcebergType, visitor: SchemaVisitor[T]) -> T:
+    """Traverse a type in post-order using an explicit stack instead of recursion.
 
-    return visitor.map(obj, key_result, value_result)
+    Entering a nested type schedules its hooks and children in reverse order, so they are
+    popped in exactly the same order as a recursive traversal would invoke them. The results
+    of the visited types are kept on a separate stack, from which the parent takes them when
+    it is left.
+    """
+    stack: List[Tuple[int, Any]] = [(_ENTER, obj)]
+    results: List[T] = []
+    # Bind the methods that are called for every node once, instead of looking them up in the loop
+    push = stack.append
+    pop = stack.pop
+    append_result = results.append
+    pop_result = results.pop
+    node_kinds = _NODE_KINDS
+    primitive = visitor.primitive
+    visit_field = visitor.field
+    # Most visitors do not override the field hooks, so these are skipped entirely
+    before_field: Optional[Callable[[NestedField], None]] = (
+        visitor.before_field if type(visitor).before_field is not SchemaVisitor.before_field else None
+    )
+    after_field: Optional[Callable[[NestedField], None]] = (
+        visitor.after_field if type(visitor).after_field is not SchemaVisitor.after_field else None
+    )
 
+    while stack:
+        step, node = pop()
+        if step == _ENTER:
+            kind = node_kinds.get(type(node)) or _node_kind(node)
+            if kind == _PRIMITIVE:
+                append_result(primitive(node))
+            elif kind == _STRUCT:
+                push((_LEAVE_STRUCT, node))
+                for field in reversed(node.fields):
+                    push((_LEAVE_FIELD, field))
+                    push((_ENTER, field.field_type))
+                    if before_field is not None:
+                        push((_BEFORE_FIELD, field))
+            elif kind == _LIST:
+                push((_LEAVE_LIST, node))
+                push((_ENTER, node.element_type))
+                push((_BEFORE_LIST_ELEMENT, node.element_field))
+            else:
+                push((_LEAVE_MAP, node))
+                push((_AFTER_MAP_VALUE, node.value_field))
+                push((_ENTER, node.value_type))
+                push((_BEFORE_MAP_VALUE, node.value_field))
+                push((_AFTER_MAP_KEY, node.key_field))
+                push((_ENTER, node.key_type))
+                push((_BEFORE_MAP_KEY, node.key_field))
+        elif step == _LEAVE_FIELD:
+            result = pop_result()
+            if after_field is not None:
+                after_field(node)
+            append_result(visit_field(node, result))
+        elif step == _BEFORE_FIELD:
+            # The step is only pushed when the hook is bound, this narrows its type
+            if before_field is not None:
+                before_field(node)
+        elif step == _LEAVE_STRUCT:
+            if num_fields := len(node.fields):
+                field_results = results[-num_fields:]
+                del results[-num_fields:]
+            else:
+                field_results = []
+            append_result(visitor.struct(node, field_results))
+        elif step == _BEFORE_LIST_ELEMENT:
+            visitor.before_list_element(node)
+        elif step == _LEAVE_LIST:
+            result = pop_result()
+            visitor.after_list_element(node.element_field)
+            append_result(visitor.list(node, result))
+        elif step == _BEFORE_MAP_KEY:
+            visitor.before_map_key(node)
+        elif step == _AFTER_MAP_KEY:
+            visitor.after_map_key(node)
+        elif step == _BEFORE_MAP_VALUE:
+            visitor.before_map_value(node)
+        elif step == _AFTER_MAP_VALUE:
+            visitor.after_map_value(node)
+        else:
+            value_result = pop_result()
+            key_result = pop_result()
+            append_result(visitor.map(node, key_result, value_result))
 
-@visit.register(PrimitiveType)
-def _(obj: PrimitiveType, visitor: SchemaVisitor[T]) -> T:
-    """Visit a PrimitiveType with a concrete SchemaVisitor."""
-    return visitor.primitive(obj)
+    return results.pop()
 
 
 @singledispatch
@@ -1015,106 +1165,66 @@ class _IndexById(SchemaVisitor[Dict[int, NestedField]]):
 def index_by_id(schema_or_type: Union[Schema, IcebergType]) -> Dict[int, NestedField]:
     """Generate an index of field IDs to NestedField instances.
 
+    When a Schema is passed in, a copy of the index that is cached on the schema is returned.
+
     Args:
         schema_or_type (Union[Schema, IcebergType]): A schema or type to index.
 
     Returns:
         Dict[int, NestedField]: An index of field IDs to NestedField instances.
     """
+    if isinstance(schema_or_type, Schema):
+        return dict(schema_or_type._lazy_id_to_field)
+    elif isinstance(schema_or_type, PrimitiveType):
+        return EMPTY_DICT
     return visit(schema_or_type, _IndexById())
 
 
-class _IndexParents(SchemaVisitor[Dict[int, int]]):
-    def __init__(self) -> None:
-        self.id_to_parent: Dict[int, int] = {}
-        self.id_stack: List[int] = []
-
-    def before_field(self, field: NestedField) -> None:
-        self.id_stack.append(field.field_id)
-
-    def after_field(self, field: NestedField) -> None:
-        self.id_stack.pop()
-
-    def schema(self, schema: Schema, struct_result: Dict[int, int]) -> Dict[int, int]:
-        return self.id_to_parent
-
-    def struct(self, struct: StructType, field_results: List[Dict[int, int]]) -> Dict[int, int]:
-        for field in struct.fields:
-            parent_id = self.id_stack[-1] if self.id_stack else None
-            if parent_id is not None:
-                # fields in the root struct are not added
-                self.id_to_parent[field.field_id] = parent_id
-
-        return self.id_to_parent
-
-    def field(self, field: NestedField, field_result: Dict[int, int]) -> Dict[int, int]:
-        return self.id_to_parent
-
-    def list(self, list_type: ListType, element_result: Dict[int, int]) -> Dict[int, int]:
-        self.id_to_parent[list_type.element_id] = self.id_stack[-1]
-        return self.id_to_parent
-
-    def map(self, map_type: MapType, key_result: Dict[int, int], value_result: Dict[int, int]) -> Dict[int, int]:
-        self.id_to_parent[map_type.key_id] = self.id_stack[-1]
-        self.id_to_parent[map_type.value_id] = self.id_stack[-1]
-        return self.id_to_parent
-
-    def primitive(self, primitive: PrimitiveType) -> Dict[int, int]:
-        return self.id_to_parent
-
-
-def _index_parents(schema_or_type: Union[Schema, IcebergType]) -> Dict[int, int]:
-    """Generate an index of field IDs to their parent field IDs.
-
-    Args:
-        schema_or_type (Union[Schema, IcebergType]): A schema or type to index.
+class _IndexByName(SchemaVisitor[Dict[str, int]]):
+    """A schema visitor for generating a field name to field ID index.
 
-    Returns:
-        Dict[int, int]: An index of field IDs to their parent field IDs.
+    The dotted prefixes of the enclosing fields are kept on a stack, where each prefix
+    extends the one before it, so a full name takes a single concatenation to build.
     """
-    return visit(schema_or_type, _IndexParents())
-
 
-class _IndexByName(SchemaVisitor[Dict[str, int]]):
-    """A schema visitor for generating a field name to field ID index."""
-
-    def __init__(self) -> None:
+    def __init__(self, short_names: bool = True) -> None:
         self._index: Dict[str, int] = {}
         self._short_name_to_id: Dict[str, int] = {}
-        self._combined_index: Dict[str, int] = {}
-        self._field_names: List[str] = []
-        self._short_field_names: List[str] = []
+        self._prefixes: List[str] = [""]
+        # The short prefixes stay empty when no short names are collected
+        self._short_prefixes: List[str] = [""]
+        self._short_names = short_names
+
+    def _push(self, name: str, short: bool = True) -> None:
+        self._prefixes.append(f"{self._prefixes[-1]}{name}.")
+        if short and self._short_names:
+            self._short_prefixes.append(f"{self._short_prefixes[-1]}{name}.")
+
+    def _pop(self, short: bool = True) -> None:
+        self._prefixes.pop()
+        if short and self._short_names:
+            self._short_prefixes.pop()
 
     def before_map_value(self, value: NestedField) -> None:
-        if not isinstance(value.field_type, StructType):
-            self._short_field_names.append(value.name)
-        self._field_names.append(value.name)
+        self._push(value.name, short=not isinstance(value.field_type, StructType))
 
     def after_map_value(self, value: NestedField) -> None:
-        if not isinstance(value.field_type, StructType):
-            self._short_field_names.pop()
-        self._field_names.pop()
+        self._pop(short=not isinstance(value.field_type, StructType))
 
     def before_list_element(self, element: NestedField) -> None:
         """Short field names omit element when the element is a StructType."""
-        if not isinstance(element.field_type, StructType):
-            self._short_field_names.append(element.name)
-        self._field_names.append(element.name)
+        self._push(element.name, short=not isinstance(element.field_type, StructType))
 
     def after_list_element(self, element: NestedField) -> None:
-        if not isinstance(element.field_type, StructType):
-            self._short_field_names.pop()
-        self._field_names.pop()
+        self._pop(short=not isinstance(element.field_type, StructType))
 
     def before_field(self, field: NestedField) -> None:
         """Store the field name."""
-        self._field_names.append(field.name)
-        self._short_field_names.append(field.name)
+        self._push(field.name)
 
     def after_field(self, field: NestedField) -> None:
         """Remove the last field name stored."""
-        self._field_names.pop()
-        self._short_field_names.pop()
+        self._pop()
 
     def schema(self, schema: Schema, struct_result: Dict[str, int]) -> Dict[str, int]:
         return self._index
@@ -1148,18 +1258,14 @@ class _IndexByName(SchemaVisitor[Dict[str, int]]):
         Raises:
             ValueError: If the field name is already contained in the index.
         """
-        full_name = name
-
-        if self._field_names:
-            full_name = ".".join([".".join(self._field_names), name])
+        full_name = self._prefixes[-1] + name
 
         if full_name in self._index:
             raise ValueError(f"Invalid schema, multiple fields for name {full_name}: {self._index[full_name]} and {field_id}")
         self._index[full_name] = field_id
 
-        if self._short_field_names:
-            short_name = ".".join([".".join(self._short_field_names), name])
-            self._short_name_to_id[short_name] = field_id
+        if short_prefix := self._short_prefixes[-1]:
+            self._short_name_to_id[short_prefix + name] = field_id
 
     def primitive(self, primitive: PrimitiveType) -> Dict[str, int]:
         return self._index
@@ -1173,6 +1279,10 @@ class _IndexByName(SchemaVisitor[Dict[str, int]]):
         combined_index.update(self._index)
         return combined_index
 
+    def by_full_name(self) -> Dict[str, int]:
+        """Return an index of full names to ID, without the short names."""
+        return self._index
+
     def by_id(self) -> Dict[int, str]:
         """Return an index of ID to full names."""
         id_to_full_name = {value: key for key, value in self._index.items()}
@@ -1182,16 +1292,29 @@ class _IndexByName(SchemaVisitor[Dict[str, int]]):
 def index_by_name(schema_or_type: Union[Schema, IcebergType]) -> Dict[str, int]:
     """Generate an index of field names to field IDs.
 
+    When a Schema is passed in, a copy of the index that is cached on the schema is returned.
+
     Args:
         schema_or_type (Union[Schema, IcebergType]): A schema or type to index.
 
     Returns:
         Dict[str, int]: An index of field names to field IDs.
     """
-    if len(schema_or_type.fields) > 0:
-        indexer = _IndexByName()
-        visit(schema_or_type, indexer)
-        return indexer.by_name()
+    if isinstance(schema_or_type, Schema):
+        return dict(schema_or_type._lazy_name_to_id)
+    elif isinstance(schema_or_type, PrimitiveType):
+        return EMPTY_DICT
+    indexer = _IndexByName()
+    visit(schema_or_type, indexer)
+    return indexer.by_name()
+
+
+def _index_full_names(schema: Schema) -> Dict[str, int]:
+    """Return an index of only the full names to field IDs, which also checks that the names are unique."""
+    if len(schema.fields) > 0:
+        indexer = _IndexByName(short_names=False)
+        visit(schema, indexer)
+        return indexer.by_full_name()
     else:
         return EMPTY_DICT
 
@@ -1199,12 +1322,16 @@ def index_by_name(schema_or_type: Union[Schema, IcebergType]) -> Dict[str, int]:
 def index_name_by_id(schema_or_type: Union[Schema, IcebergType]) -> Dict[int, str]:
     """Generate an index of field IDs full field names.
 
+    When a Schema is passed in, a copy of the index that is cached on the schema is returned.
+
     Args:
         schema_or_type (Union[Schema, IcebergType]): A schema or type to index.
 
     Returns:
         Dict[str, int]: An index of field IDs to full names.
     """
+    if isinstance(schema_or_type, Schema):
+        return dict(schema_or_type._lazy_id_to_name)
     indexer = _IndexByName()
     visit(schema_or_type, indexer)
     return indexer.by_id()
@@ -1213,8 +1340,16 @@ def index_name_by_id(schema_or_type: Union[Schema, IcebergType]) -> Dict[int, st
 Position = int
 
 
-class _BuildPositionAccessors(SchemaVisitor[Dict[Position, Accessor]]):
-    """A schema visitor for generating a field ID to accessor index.
+@cache
+def _leaf_accessor(position: Position) -> Accessor:
+    """Return the accessor for a position that has no inner accessor, which is shared by all schemas."""
+    return Accessor(position)
+
+
+def build_position_accessors(schema_or_type: Union[Schema, IcebergType]) -> Dict[int, Accessor]:
+    """Generate an index of field IDs to schema position accessors.
+
+    Only fields that can be reached through structs get an accessor, fields in lists and maps are not indexed.
 
     Example:
         >>> from pyiceberg.schema import Schema
@@ -1239,52 +1374,56 @@ class _BuildPositionAccessors(SchemaVisitor[Dict[Position, Accessor]]):
         ...     2: Accessor(position=0, inner=None),
         ...     1: Accessor(position=1, inner=None),
         ...     5: Accessor(position=2, inner=Accessor(position=0, inner=None)),
-        ...     6: Accessor(position=2, inner=Accessor(position=1, inner=None))
+        ...     6: Accessor(position=2, inner=Accessor(position=1, inner=None)),
         ...     3: Accessor(position=2, inner=None),
         ... }
         >>> result == expected
         True
-    """
-
-    def schema(self, schema: Schema, struct_result: Dict[Position, Accessor]) -> Dict[Position, Accessor]:
-        return struct_result
-
-    def struct(self, struct: StructType, field_results: List[Dict[Position, Accessor]]) -> Dict[Position, Accessor]:
-        result = {}
-
-        for position, field in enumerate(struct.fields):
-            if field_results[position]:
-                for inner_field_id, acc in field_results[position].items():
-                    result[inner_field_id] = Accessor(position, inner=acc)
-            result[field.field_id] = Accessor(position)
-
-        return result
-
-    def field(self, field: NestedField, field_result: Dict[Position, Accessor]) -> Dict[Position, Accessor]:
-        return field_result
-
-    def list(self, list_type: ListType, element_result: Dict[Position, Accessor]) -> Dict[Position, Accessor]:
-        return {}
-
-    def map(
-        self, map_type: MapType, key_result: Dict[Position, Accessor], value_result: Dict[Position, Accessor]
-    ) -> Dict[Position, Accessor]:
-        return {}
-
-    def primitive(self, primitive: PrimitiveType) -> Dict[Position, Accessor]:
-        return {}
-
-
-def build_position_accessors(schema_or_type: Union[Schema, IcebergType]) -> Dict[int, Accessor]:
-    """Generate an index of field IDs to schema position accessors.
 
     Args:
         schema_or_type (Union[Schema, IcebergType]): A schema or type to index.
 
     Returns:
         Dict[int, Accessor]: An index of field IDs to accessors.
+
+    Raises:
+        NotImplementedError: If attempting to index an unrecognized object type.
     """
-    return visit(schema_or_type, _BuildPositionAccessors())
+    if isinstance(schema_or_type, Schema):
+        fields = schema_or_type.fields
+    elif isinstance(schema_or_type, StructType):
+        fields = schema_or_type.fields
+    elif isinstance(schema_or_type, IcebergType):
+        return EMPTY_DICT
+    else:
+        raise NotImplementedError(f"Cannot visit non-type: {schema_or_type}")
+
+    if not fields:
+        return EMPTY_DICT
+
+    result: Dict[int, Accessor] = {}
+    # The fields of a nested struct are indexed before the struct itself, the
+    # positions are the path of positions from the outermost struct to the field
+    stack: List[Tuple[Tuple[Position, ...], NestedField, bool]] = [
+        ((position,), field, False) for position, field in reversed(list(enumerate(fields)))
+    ]
+    while stack:
+        positions, field, expanded = stack.pop()
+        field_type = field.field_type
+        if not expanded and isinstance(field_type, StructType):
+            stack.append((positions, field, True))
+            stack.extend(
+                (positions + (position,), inner_field, False)
+                for position, inner_field in reversed(list(enumerate(field_type.fields)))
+            )
+            continue
+
+        accessor = _leaf_accessor(positions[-1])
+        for position in reversed(positions[:-1]):
+            accessor = Accessor(position, inner=accessor)
+        result[field.field_id] = accessor
+
+    return result
 
 
 def assign_fresh_schema_ids(schema_or_type: Union[Schema, IcebergType], next_id: Optional[Callable[[], int]] = None) -> Schema:
@@ -1318,7 +1457,7 @@ class _SetFreshIDs(PreOrderSchemaVisitor[IcebergType]):
         new_fields = []
         for field_id, field, field_type in zip(new_ids, struct.fields, field_results):
             new_fields.append(
-                NestedField(
+                NestedField.model_construct(
                     field_id=field_id,
                     name=field.name,
                     field_type=field_type(),
@@ -1326,7 +1465,7 @@ class _SetFreshIDs(PreOrderSchemaVisitor[IcebergType]):
                     doc=field.doc,
                 )
             )
-        return StructType(*new_fields)
+        return StructType.model_construct(fields=tuple(new_fields))
 
     def field(self, field: NestedField, field_result: Callable[[], IcebergType]) -> IcebergType:
         return field_result()
@@ -1354,8 +1493,16 @@ class _SetFreshIDs(PreOrderSchemaVisitor[IcebergType]):
         return primitive
 
 
+# Matches the characters that are not allowed in Avro names, which are the ones
+# that are neither alphanumeric nor an underscore: exactly the complement of \w
+_INVALID_AVRO_NAME_CHARACTERS = re.compile(r"\W")
+
+
 # Implementation copied from Apache Iceberg repo.
 def make_compatible_name(name: str) -> str:
+    if name.isascii() and name.isidentifier():
+        # For ASCII, identifiers follow exactly the Avro naming rules
+        return name
     if not _valid_avro_name(name):
         return _sanitize_name(name)
     return name
@@ -1368,26 +1515,19 @@ def _valid_avro_name(name: str) -> bool:
     if not (first.isalpha() or first == "_"):
         return False
 
-    for character in name[1:]:
-        if not (character.isalnum() or character == "_"):
-            return False
-    return True
+    return _INVALID_AVRO_NAME_CHARACTERS.search(name, 1) is None
 
 
 def _sanitize_name(name: str) -> str:
-    sb = []
     first = name[0]
     if not (first.isalpha() or first == "_"):
-        sb.append(_sanitize_char(first))
-    else:
-        sb.append(first)
+        first = _sanitize_char(first)
 
-    for character in name[1:]:
-        if not (character.isalnum() or character == "_"):
-            sb.append(_sanitize_char(character))
-        else:
-            sb.append(character)
-    return "".join(sb)
+    return first + _INVALID_AVRO_NAME_CHARACTERS.sub(_sanitize_match, name[1:])
+
+
+def _sanitize_match(match: re.Match[str]) -> str:
+    return _sanitize_char(match.group(0))
 
 
 def _sanitize_char(character: str) -> str:
@@ -1419,7 +1559,7 @@ class _SanitizeColumnsVisitor(SchemaVisitor[Optional[IcebergType]]):
         return struct_result
 
     def field(self, field: NestedField, field_result: Optional[IcebergType]) -> Optional[IcebergType]:
-        return NestedField(
+        return NestedField.model_construct(
             field_id=field.field_id,
             name=make_compatible_name(field.name),
             field_type=field_result,
@@ -1428,7 +1568,7 @@ class _SanitizeColumnsVisitor(SchemaVisitor[Optional[IcebergType]]):
         )
 
     def struct(self, struct: StructType, field_results: List[Optional[IcebergType]]) -> Optional[IcebergType]:
-        return StructType(*[field for field in field_results if field is not None])
+        return StructType.model_construct(fields=tuple(field for field in field_results if field is not None))
 
     def list(self, list_type: ListType, element_result: Optional[IcebergType]) -> Optional[IcebergType]:
         return ListType(element_id=list_type.element_id, element_type=element_result, element_required=list_type.element_required)
@@ -1459,7 +1599,15 @@ def prune_columns(schema: Schema, selected: Set[int], select_full_types: bool =
     Returns:
         The pruned schema.
     """
-    result = visit(schema.as_struct(), _PruneColumnsVisitor(selected, select_full_types))
+    if not selected:
+        return Schema(schema_id=schema.schema_id)
+    if select_full_types and schema._lazy_id_to_field.keys() <= selected:
+        # Every field is selected, which leaves the schema as it is
+        return schema
+
+    result = _PruneColumnsVisitor(selected, select_full_types).prune(
+        schema.as_struct(), _select_ancestors(selected, schema._lazy_id_to_parent)
+    )
     return Schema(
         *(result or StructType()).fields,
         schema_id=schema.schema_id,
@@ -1467,6 +1615,29 @@ def prune_columns(schema: Schema, selected: Set[int], select_full_types: bool =
     )
 
 
+def _select_ancestors(selected: Set[int], id_to_parent: Dict[int, int]) -> Set[int]:
+    """Return the selected field-ids together with the field-ids of all their ancestors.
+
+    Args:
+        selected: The selected field-ids.
+        id_to_parent: An index of field-ids to the field-id of their parent.
+
+    Returns:
+        The closure of the selected field-ids under the parent relation.
+    """
+    closure: Set[int] = set()
+    for selected_id in selected:
+        field_id: Optional[int] = selected_id
+        while field_id is not None and field_id not in closure:
+            closure.add(field_id)
+            field_id = id_to_parent.get(field_id)
+    return closure
+
+
+# A child of a nested type: its field-id, its type and, for struct children, its field
+_PruneChild = Tuple[int, IcebergType, Optional[NestedField]]
+
+
 class _PruneColumnsVisitor(SchemaVisitor[Optional[IcebergType]]):
     selected: Set[int]
     select_full_types: bool
@@ -1475,6 +1646,61 @@ class _PruneColumnsVisitor(SchemaVisitor[Optional[IcebergType]]):
         self.selected = selected
         self.select_full_types = select_full_types
 
+    def prune(self, struct: StructType, closure: Set[int]) -> Optional[IcebergType]:
+        """Prune the struct, only descending into fields that are in the closure of the selected field-ids.
+
+        This gives the same result as visiting the struct, but branches without any selected field are skipped
+        entirely, and so are the subtrees of selected fields when the full types are selected. The tree is
+        walked with an explicit stack instead of recursion.
+
+        Args:
+            struct: The struct to prune.
+            closure: The selected field-ids together with the field-ids of their ancestors.
+
+        Returns:
+            The pruned type, or None when nothing was selected.
+        """
+
+        selected = self.selected
+        select_full_types = self.select_full_types
+
+        def children(field_type: IcebergType) -> Iterator[_PruneChild]:
+            if isinstance(field_type, StructType):
+                return ((field.field_id, field.field_type, field) for field in field_type.fields)
+            elif isinstance(field_type, ListType):
+                return iter(((field_type.element_id, field_type.element_type, None),))
+            elif isinstance(field_type, MapType):
+                return iter(((field_type.value_id, field_type.value_type, None),))
+            raise NotImplementedError(f"Cannot visit non-type: {field_type}")
+
+        # Explicit stack of (nested type, the field it belongs to, its unvisited children, the results of its visited children)
+        stack: List[Tuple[IcebergType, Optional[NestedField], Iterator[_PruneChild], List[Optional[IcebergType]]]] = [
+            (struct, None, children(struct), [])
+        ]
+        while stack:
+            field_type, parent_field, pending, results = stack[-1]
+            for child_id, child_type, field in pending:
+                if child_id in closure and not (select_full_types and child_id in selected) and not child_type.is_primitive:
+                    stack.append((child_type, field, children(child_type), []))
+                    break
+                results.append(None if field is None else self.field(field, None))
+            else:
+                stack.pop()
+                result: Optional[IcebergType]
+                if isinstance(field_type, StructType):
+                    result = self.struct(field_type, results)
+                elif isinstance(field_type, ListType):
+                    result = self.list(field_type, results[0])
+                elif isinstance(field_type, MapType):
+                    result = self.map(field_type, None, results[0])
+                else:
+                    raise NotImplementedError(f"Cannot visit non-type: {field_type}")
+                if not stack:
+                    return result
+                stack[-1][3].append(result if parent_field is None else self.field(parent_field, result))
+
+        return None
+
     def schema(self, schema: Schema, struct_result: Optional[IcebergType]) -> Optional[IcebergType]:
         return struct_result
 
@@ -1485,13 +1711,15 @@ class _PruneColumnsVisitor(SchemaVisitor[Optional[IcebergType]]):
 
         for idx, projected_type in enumerate(field_results):
             field = fields[idx]
-            if field.field_type == projected_type:
+            if projected_type is None:
+                continue
+            elif field.field_type is projected_type or field.field_type == projected_type:
                 selected_fields.append(field)
-            elif projected_type is not None:
+            else:
                 same_type = False
                 # Type has changed, create a new field with the projected type
                 selected_fields.append(
-                    NestedField(
+                    NestedField.model_construct(
                         field_id=field.field_id,
                         name=field.name,
                         field_type=projected_type,
@@ -1505,7 +1733,7 @@ class _PruneColumnsVisitor(SchemaVisitor[Optional[IcebergType]]):
                 # Nothing has changed, and we can return the original struct
                 return struct
             else:
-                return StructType(*selected_fields)
+                return StructType.model_construct(fields=tuple(selected_fields))
         return None
 
     def field(self, field: NestedField, field_result: Optional[IcebergType]) -> Optional[IcebergType]:
@@ -1655,7 +1883,9 @@ def _(file_type: BinaryType, read_type: IcebergType) -> IcebergType:
 @promote.register(DecimalType)
 def _(file_type: DecimalType, read_type: IcebergType) -> IcebergType:
     if isinstance(read_type, DecimalType):
-        if file_type.precision <= read_type.precision and file_type.scale == file_type.scale:
+        if file_type.scale != read_type.scale:
+            raise ResolveError(f"Cannot change scale from {file_type} to {read_type}")
+        elif file_type.precision <= read_type.precision:
             return read_type
         else:
             raise ResolveError(f"Cannot reduce precision from {file_type} to {read_type}")
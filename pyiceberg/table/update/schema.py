@@ -17,7 +17,6 @@
 from __future__ import annotations
 
 import itertools
-from copy import copy
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
@@ -145,8 +144,13 @@ class UpdateSchema(UpdateTableMetadata["UpdateSchema"]):
     def union_by_name(self, new_schema: Union[Schema, "pa.Schema"]) -> UpdateSchema:
         from pyiceberg.catalog import Catalog
 
+        new_schema = Catalog._convert_schema_if_needed(new_schema)
+        if new_schema.fields == self._schema.fields:
+            # Nothing to add or update when the schemas have the same fields
+            return self
+
         visit_with_partner(
-            Catalog._convert_schema_if_needed(new_schema),
+            new_schema,
             -1,
             _UnionByNameVisitor(update_schema=self, existing_schema=self._schema, case_sensitive=self._case_sensitive),
             # type: ignore
@@ -651,7 +655,10 @@ class UpdateSchema(UpdateTableMetadata["UpdateSchema"]):
         Returns:
             the result Schema when all pending updates are applied
         """
-        struct = visit(self._schema, _ApplyChanges(self._adds, self._updates, self._deletes, self._moves))
+        if self._adds or self._updates or self._deletes or self._moves:
+            struct = visit(self._schema, _ApplyChanges(self._adds, self._updates, self._deletes, self._moves))
+        else:
+            struct = self._schema.as_struct()
         if struct is None:
             # Should never happen
             raise ValueError("Could not apply changes")
@@ -709,7 +716,7 @@ class _ApplyChanges(SchemaVisitor[Optional[IcebergType]]):
                 raise ValueError(f"Cannot add fields to non-struct: {struct_result}")
 
             if new_fields := _add_and_move_fields(struct_result.fields, added or [], moves or []):
-                return StructType(*new_fields)
+                return StructType.model_construct(fields=new_fields)
 
         return struct_result
 
@@ -750,7 +757,7 @@ class _ApplyChanges(SchemaVisitor[Optional[IcebergType]]):
             else:
                 has_changes = True
                 new_fields.append(
-                    NestedField(
+                    NestedField.model_construct(
                         field_id=field.field_id,
                         name=name,
                         field_type=result_type,
@@ -762,7 +769,7 @@ class _ApplyChanges(SchemaVisitor[Optional[IcebergType]]):
                 )
 
         if has_changes:
-            return StructType(*new_fields)
+            return StructType.model_construct(fields=tuple(new_fields))
 
         return struct
 
@@ -784,7 +791,7 @@ class _ApplyChanges(SchemaVisitor[Optional[IcebergType]]):
                     raise ValueError(f"Cannot add fields to non-struct: {field}")
 
                 if new_fields := _add_and_move_fields(field_result.fields, added or [], moves or []):
-                    return StructType(*new_fields)
+                    return StructType.model_construct(fields=new_fields)
 
         return field_result
 
@@ -994,15 +1001,13 @@ def _add_fields(fields: Tuple[NestedField, ...], adds: Optional[List[NestedField
 
 
 def _move_fields(fields: Tuple[NestedField, ...], moves: List[_Move]) -> Tuple[NestedField, ...]:
-    reordered = list(copy(fields))
+    reordered = list(fields)
     for move in moves:
-        # Find the field that we're about to move
-        field = next(field for field in reordered if field.field_id == move.field_id)
-        # Remove the field that we're about to move from the list
-        reordered = [field for field in reordered if field.field_id != move.field_id]
+        # Find the field that we're about to move, and remove it from the list
+        field = reordered.pop(next(i for i, field in enumerate(reordered) if field.field_id == move.field_id))
 
         if move.op == _MoveOperation.First:
-            reordered = [field] + reordered
+            reordered.insert(0, field)
         elif move.op == _MoveOperation.Before or move.op == _MoveOperation.After:
             other_field_id = move.other_field_id
             other_field_pos = next(i for i, field in enumerate(reordered) if field.field_id == other_field_id)
@@ -19,11 +19,13 @@ from __future__ import annotations
 from abc import abstractmethod
 from datetime import date, datetime, time
 from decimal import Decimal
+from functools import cache, cached_property
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Generic,
     List,
     Literal,
@@ -110,6 +112,12 @@ class StructProtocol(Protocol):  # pragma: no cover
         """Assign a value to a StructProtocol."""
 
 
+@cache
+def _cached_property_names(cls: type) -> FrozenSet[str]:
+    """Return the names of the cached properties of a class, including the inherited ones."""
+    return frozenset(name for klass in cls.__mro__ for name, value in vars(klass).items() if isinstance(value, cached_property))
+
+
 class IcebergBaseModel(BaseModel):
     """
     This class extends the Pydantic BaseModel to set default values by overriding them.
@@ -135,6 +143,27 @@ class IcebergBaseModel(BaseModel):
             {field for field in self.__dict__ if field.startswith("_") and not field == "__root__"}, exclude or set()
         )
 
+    def _without_cached_properties(self) -> Self:
+        # The cached properties are derived from the fields, which can be updated on a copy
+        for name in _cached_property_names(type(self)):
+            self.__dict__.pop(name, None)
+        return self
+
+    def __copy__(self) -> Self:
+        """Return a shallow copy of the model, without the values of its cached properties."""
+        return super().__copy__()._without_cached_properties()
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> Self:
+        """Return a deep copy of the model, without the values of its cached properties."""
+        return super().__deepcopy__(memo)._without_cached_properties()
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        """Return the state to pickle, without the values of the cached properties."""
+        state = super().__getstate__()
+        cached = _cached_property_names(type(self))
+        state["__dict__"] = {name: value for name, value in state["__dict__"].items() if name not in cached}
+        return state
+
     def model_dump(
         self, exclude_none: bool = True, exclude: Optional[Set[str]] = None, by_alias: bool = True, **kwargs: Any
     ) -> Dict[str, Any]:
@@ -43,11 +43,11 @@ from typing import (
     Optional,
     Tuple,
 )
+from weakref import WeakValueDictionary
 
 from pydantic import (
     BeforeValidator,
     Field,
-    PrivateAttr,
     SerializeAsAny,
     field_validator,
     model_serializer,
@@ -194,6 +194,19 @@ class PrimitiveType(Singleton, IcebergRootModel[str], IcebergType):
 
     root: Any = Field()
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # Singleton.__new__ hands back the cached instance, which has already been validated
+        if "root" not in self.__dict__:
+            super().__init__(*args, **kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare the type to another type, which is most often the same singleton instance."""
+        return self is other or (type(self) is type(other) and self.root == other.root)
+
+    def __hash__(self) -> int:
+        """Return the hash of the root, which is consistent with the equality."""
+        return hash(self.root)
+
     def __repr__(self) -> str:
         """Return the string representation of the PrimitiveType class."""
         return f"{type(self).__name__}()"
@@ -353,6 +366,44 @@ class NestedField(IcebergType):
                 raise ValueError(f"Unsupported field type: '{v}'") from e
         return v
 
+    _interned: ClassVar[WeakValueDictionary[Tuple[Any, ...], NestedField]] = WeakValueDictionary()
+    # Set on the instance once it is initialized, so an interned field is not initialized again
+    _initialized: ClassVar[bool] = False
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> NestedField:
+        """Return the field that was deserialized earlier with the same values, if it is still alive.
+
+        Only fields that are deserialized, which pass their values by alias, are interned. That is
+        where the duplicates come from: the same columns re-appear in every schema of the table
+        metadata. Fields that are created in code mostly have new ids or names, and would only pay
+        for the lookup. Only fields of a primitive type without default values are interned. Those are
+        by far the most common and are cheap to hash. Defaults are excluded because values such as
+        Decimal("1.0") and Decimal("1.00") are equal while being different defaults.
+        """
+        if "id" not in kwargs:
+            return super().__new__(cls)
+
+        field_type = kwargs.get("type")
+        if (
+            args
+            or not isinstance(field_type, (str, PrimitiveType))
+            or kwargs.get("initial_default") is not None
+            or kwargs.get("write_default") is not None
+            or "initial-default" in kwargs
+            or "write-default" in kwargs
+        ):
+            return super().__new__(cls)
+
+        key = (cls, tuple(kwargs.items()))
+        try:
+            field = cls._interned.get(key)
+        except TypeError:
+            # An unhashable argument, which is left to the validation to reject
+            return super().__new__(cls)
+        if field is None:
+            field = cls._interned[key] = super().__new__(cls)
+        return field
+
     def __init__(
         self,
         field_id: Optional[int] = None,
@@ -364,6 +415,10 @@ class NestedField(IcebergType):
         write_default: Optional[L] = None,
         **data: Any,
     ):
+        if self._initialized:
+            # An interned field that has already been initialized
+            return
+
         # We need an init when we want to use positional arguments, but
         # need also to support the aliases.
         data["id"] = data["id"] if "id" in data else field_id
@@ -374,6 +429,7 @@ class NestedField(IcebergType):
         data["initial-default"] = data["initial-default"] if "initial-default" in data else initial_default
         data["write-default"] = data["write-default"] if "write-default" in data else write_default
         super().__init__(**data)
+        object.__setattr__(self, "_initialized", True)
 
     @model_serializer()
     def serialize_model(self) -> Dict[str, Any]:
@@ -401,9 +457,27 @@ class NestedField(IcebergType):
         req = "required" if self.required else "optional"
         return f"{self.field_id}: {self.name}: {req} {self.field_type}{doc}"
 
-    def __getnewargs__(self) -> Tuple[int, str, IcebergType, bool, Optional[str]]:
+    def __getnewargs__(self) -> Tuple[int, str, IcebergType, bool, Optional[str], Optional[Any], Optional[Any]]:
         """Pickle the NestedField class."""
-        return (self.field_id, self.name, self.field_type, self.required, self.doc)
+        return (self.field_id, self.name, self.field_type, self.required, self.doc, self.initial_default, self.write_default)
+
+    def _key(self) -> Tuple[Any, ...]:
+        """Return the values of the field as a tuple, which are compared for equality."""
+        return (self.field_id, self.name, self.field_type, self.required, self.doc, self.initial_default, self.write_default)
+
+    @cached_property
+    def _hash(self) -> int:
+        return hash(self._key())
+
+    def __hash__(self) -> int:
+        """Use the cached hash value of the NestedField class."""
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare the object if it is equal to another object."""
+        if self is other:
+            return True
+        return self._hash == other._hash and self._key() == other._key() if isinstance(other, NestedField) else False
 
     @property
     def optional(self) -> bool:
@@ -423,32 +497,45 @@ class StructType(IcebergType):
 
     type: Literal["struct"] = Field(default="struct")
     fields: Tuple[NestedField, ...] = Field(default_factory=tuple)
-    _hash: int = PrivateAttr()
 
     def __init__(self, *fields: NestedField, **data: Any):
         # In case we use positional arguments, instead of keyword args
         if fields:
             data["fields"] = fields
         super().__init__(**data)
-        self._hash = hash(self.fields)
 
     def field(self, field_id: int) -> Optional[NestedField]:
-        for field in self.fields:
-            if field.field_id == field_id:
-                return field
-        return None
+        return self._id_to_field.get(field_id)
 
     def field_by_name(self, name: str, case_sensitive: bool = True) -> Optional[NestedField]:
         if case_sensitive:
-            for field in self.fields:
-                if field.name == name:
-                    return field
+            return self._name_to_field.get(name)
         else:
-            name_lower = name.lower()
-            for field in self.fields:
-                if field.name.lower() == name_lower:
-                    return field
-        return None
+            return self._lower_name_to_field.get(name.lower())
+
+    @cached_property
+    def _id_to_field(self) -> Dict[int, NestedField]:
+        """Return an index of field IDs to the first field with that ID."""
+        index: Dict[int, NestedField] = {}
+        for field in self.fields:
+            index.setdefault(field.field_id, field)
+        return index
+
+    @cached_property
+    def _name_to_field(self) -> Dict[str, NestedField]:
+        """Return an index of field names to the first field with that name."""
+        index: Dict[str, NestedField] = {}
+        for field in self.fields:
+            index.setdefault(field.name, field)
+        return index
+
+    @cached_property
+    def _lower_name_to_field(self) -> Dict[str, NestedField]:
+        """Return an index of lower-case field names to the first field with that name."""
+        index: Dict[str, NestedField] = {}
+        for field in self.fields:
+            index.setdefault(field.name.lower(), field)
+        return index
 
     def __str__(self) -> str:
         """Return the string representation of the StructType class."""
@@ -466,13 +553,23 @@ class StructType(IcebergType):
         """Pickle the StructType class."""
         return self.fields
 
+    @cached_property
+    def _hash(self) -> int:
+        """Hash the fields, which in turn hash their types, so the hash of a nested type is computed only once."""
+        return hash(self.fields)
+
     def __hash__(self) -> int:
         """Use the cache hash value of the StructType class."""
         return self._hash
 
     def __eq__(self, other: Any) -> bool:
         """Compare the object if it is equal to another object."""
-        return self.fields == other.fields if isinstance(other, StructType) else False
+        if self is other:
+            return True
+        if not isinstance(other, StructType):
+            return False
+        # The hashes are cached, and differ for almost any two different structs
+        return self._hash == other._hash and self.fields == other.fields
 
 
 class ListType(IcebergType):
@@ -487,8 +584,6 @@ class ListType(IcebergType):
     element_id: int = Field(alias="element-id")
     element_type: SerializeAsAny[IcebergType] = Field(alias="element")
     element_required: bool = Field(alias="element-required", default=True)
-    _element_field: NestedField = PrivateAttr()
-    _hash: int = PrivateAttr()
 
     def __init__(
         self, element_id: Optional[int] = None, element: Optional[IcebergType] = None, element_required: bool = True, **data: Any
@@ -497,7 +592,6 @@ class ListType(IcebergType):
         data["element"] = element or data["element_type"]
         data["element-required"] = data["element-required"] if "element-required" in data else element_required
         super().__init__(**data)
-        self._hash = hash(data.values())
 
     @cached_property
     def element_field(self) -> NestedField:
@@ -516,12 +610,18 @@ class ListType(IcebergType):
         """Pickle the ListType class."""
         return (self.element_id, self.element_type, self.element_required)
 
+    @cached_property
+    def _hash(self) -> int:
+        return hash(self.__getnewargs__())
+
     def __hash__(self) -> int:
-        """Use the cache hash value of the StructType class."""
+        """Use the cache hash value of the ListType class."""
         return self._hash
 
     def __eq__(self, other: Any) -> bool:
         """Compare the list type to another list type."""
+        if self is other:
+            return True
         return self.element_field == other.element_field if isinstance(other, ListType) else False
 
 
@@ -539,7 +639,6 @@ class MapType(IcebergType):
     value_id: int = Field(alias="value-id")
     value_type: SerializeAsAny[IcebergType] = Field(alias="value")
     value_required: bool = Field(alias="value-required", default=True)
-    _hash: int = PrivateAttr()
 
     def __init__(
         self,
@@ -556,7 +655,6 @@ class MapType(IcebergType):
         data["value"] = data["value"] if "value" in data else value_type
         data["value-required"] = data["value-required"] if "value-required" in data else value_required
         super().__init__(**data)
-        self._hash = hash(self.__getnewargs__())
 
     @cached_property
     def key_field(self) -> NestedField:
@@ -584,12 +682,18 @@ class MapType(IcebergType):
         """Pickle the MapType class."""
         return (self.key_id, self.key_type, self.value_id, self.value_type, self.value_required)
 
+    @cached_property
+    def _hash(self) -> int:
+        return hash(self.__getnewargs__())
+
     def __hash__(self) -> int:
         """Return the hash of the MapType."""
         return self._hash
 
     def __eq__(self, other: Any) -> bool:
         """Compare the MapType to another object."""
+        if self is other:
+            return True
         return (
             self.key_field == other.key_field and self.value_field == other.value_field if isinstance(other, MapType) else False
         )
@@ -43,10 +43,11 @@ class Singleton:
     _instances: ClassVar[Dict] = {}  # type: ignore
 
     def __new__(cls, *args, **kwargs):  # type: ignore
-        key = (cls, tuple(args), _convert_to_hashable_type(kwargs))
-        if key not in cls._instances:
-            cls._instances[key] = super().__new__(cls)
-        return cls._instances[key]
+        key = (cls, args, _convert_to_hashable_type(kwargs) if kwargs else ())
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances[key] = super().__new__(cls)
+        return instance
 
     def __deepcopy__(self, memo: Dict[int, Any]) -> Any:
         """
@@ -15,10 +15,13 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import pickle
+import re
+import sys
+from functools import cache
 from textwrap import dedent
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
-import pyarrow as pa
 import pytest
 
 from pyiceberg.exceptions import ResolveError, ValidationError
@@ -28,6 +31,7 @@ from pyiceberg.schema import (
     build_position_accessors,
     index_by_id,
     index_by_name,
+    index_name_by_id,
     promote,
     prune_columns,
     sanitize_column_names,
@@ -57,7 +61,7 @@ from pyiceberg.types import (
     UUIDType,
 )
 
-TEST_PRIMITIVE_TYPES = [
+TEST_PRIMITIVE_TYPES = (
     BooleanType(),
     IntegerType(),
     LongType(),
@@ -74,7 +78,15 @@ TEST_PRIMITIVE_TYPES = [
     FixedType(16),
     FixedType(20),
     UUIDType(),
-]
+)
+
+_PRIMITIVE_NAMES = {primitive_type: str(primitive_type) for primitive_type in TEST_PRIMITIVE_TYPES}
+
+
+@cache
+def _primitive_field(field_id: int, primitive_type: PrimitiveType) -> NestedField:
+    """Return an optional field of a primitive type named after the type, which is shared between the tests."""
+    return NestedField(field_id=field_id, name=_PRIMITIVE_NAMES[primitive_type], field_type=primitive_type, required=False)
 
 
 def test_schema_str(table_schema_simple: Schema) -> None:
@@ -339,6 +351,61 @@ def test_schema_find_field_type_by_id(table_schema_simple: Schema) -> None:
     assert index[3] == NestedField(field_id=3, name="baz", field_type=BooleanType(), required=False)
 
 
+def test_schema_index_is_cached(table_schema_nested: Schema) -> None:
+    """Test that the indexes of a schema are only computed once"""
+    index = index_by_id(table_schema_nested)
+    assert table_schema_nested.__dict__["_lazy_id_to_field"] == index
+    assert index_by_id(table_schema_nested) is not index
+    assert table_schema_nested._lazy_name_to_id is table_schema_nested._lazy_name_to_id
+    assert index_by_id(table_schema_nested) == index_by_id(table_schema_nested.as_struct())
+    assert index_by_name(table_schema_nested) == index_by_name(table_schema_nested.as_struct())
+
+
+def test_schema_short_names_are_indexed_on_demand(table_schema_nested: Schema) -> None:
+    """Test that the short names are only indexed when a name is not found among the full names"""
+    schema = Schema(*table_schema_nested.fields)
+    assert schema.find_field("location.element.latitude").field_id == 13
+    assert "_lazy_name_to_id" not in schema.__dict__
+    assert schema.find_field("location.latitude").field_id == 13
+    assert index_by_name(schema)["location.latitude"] == 13
+
+
+def test_schema_indexes_are_copies(table_schema_nested: Schema) -> None:
+    schema = Schema(*table_schema_nested.fields)
+    index_by_id(schema)[99] = NestedField(99, "new", StringType())
+    index_by_id(schema).pop(1)
+    index_by_name(schema)["new"] = 99
+    del index_name_by_id(schema)[1]
+
+    with pytest.raises(ValueError):
+        schema.find_field(99)
+    with pytest.raises(ValueError):
+        schema.find_field("new")
+    assert schema.find_field(1).name == "foo"
+    assert schema.find_column_name(1) == "foo"
+
+
+def test_empty_indexes_are_shared() -> None:
+    assert index_by_id(Schema()) == {}
+    assert index_by_name(Schema()) == {}
+    assert index_by_id(StringType()) is EMPTY_DICT
+    assert index_by_name(StringType()) is EMPTY_DICT
+    assert build_position_accessors(Schema()) is EMPTY_DICT
+    assert build_position_accessors(ListType(element_id=1, element_type=StringType())) is EMPTY_DICT
+
+
+def test_index_by_id_deeply_nested_type() -> None:
+    """Test that visiting a type does not recurse for every level of nesting"""
+    depth = sys.getrecursionlimit() + 100
+    nested_type: IcebergType = StringType()
+    for element_id in range(1, depth + 1):
+        nested_type = ListType(element_id=element_id, element_type=nested_type, element_required=True)
+
+    index = index_by_id(nested_type)
+    assert len(index) == depth
+    assert index[1].field_type == StringType()
+
+
 def test_index_by_id_schema_visitor_raise_on_unregistered_type() -> None:
     """Test raising a NotImplementedError when an invalid type is provided to the index_by_id function"""
     with pytest.raises(NotImplementedError) as exc_info:
@@ -405,6 +472,20 @@ def test_build_position_accessors(table_schema_nested: Schema) -> None:
     }
 
 
+def test_build_position_accessors_shares_leaf_accessors(table_schema_nested: Schema, table_schema_simple: Schema) -> None:
+    nested_accessors = build_position_accessors(table_schema_nested)
+    simple_accessors = build_position_accessors(table_schema_simple)
+    assert nested_accessors[1] is simple_accessors[1]
+    assert nested_accessors[16].inner is nested_accessors[1]
+    assert build_position_accessors(ListType(element_id=1, element_type=StringType())) == {}
+
+
+def test_accessor_pickle() -> None:
+    accessor = Accessor(position=2, inner=Accessor(position=1))
+    assert not hasattr(accessor, "__dict__")
+    assert pickle.loads(pickle.dumps(accessor)) == accessor
+
+
 def test_build_position_accessors_with_struct(table_schema_nested: Schema) -> None:
     class TestStruct(StructProtocol):
         def __init__(self, pos: Dict[int, Any] = EMPTY_DICT):
@@ -427,6 +508,17 @@ def test_serialize_schema(table_schema_with_full_nested_fields: Schema) -> None:
     actual = table_schema_with_full_nested_fields.model_dump_json()
     expected = """{"type":"struct","fields":[{"id":1,"name":"foo","type":"string","required":false,"doc":"foo doc","initial-default":"foo initial","write-default":"foo write"},{"id":2,"name":"bar","type":"int","required":true,"doc":"bar doc","initial-default":42,"write-default":43},{"id":3,"name":"baz","type":"boolean","required":false,"doc":"baz doc","initial-default":true,"write-default":false}],"schema-id":1,"identifier-field-ids":[2]}"""
     assert actual == expected
+    assert table_schema_with_full_nested_fields.model_dump_json() is actual
+
+
+def test_serialize_schema_not_cached_for_other_arguments_and_copies(table_schema_simple: Schema) -> None:
+    cached = table_schema_simple.model_dump_json()
+    assert table_schema_simple.model_dump_json(by_alias=False) != cached
+    assert table_schema_simple.model_dump_json(indent=2) != cached
+
+    copied = table_schema_simple.model_copy(update={"schema_id": 5})
+    assert '"schema-id":5' in copied.model_dump_json()
+    assert '"schema-id":5' in copied.model_copy(deep=True).model_dump_json()
 
 
 def test_deserialize_schema(table_schema_with_full_nested_fields: Schema) -> None:
@@ -821,6 +913,18 @@ def test_prune_columns_select_original_schema(table_schema_nested: Schema) -> No
     assert prune_columns(table_schema_nested, ids, True) == table_schema_nested
 
 
+def test_prune_columns_select_all_ids(table_schema_nested: Schema) -> None:
+    ids = set(range(1, table_schema_nested.highest_field_id + 1))
+    assert prune_columns(table_schema_nested, ids, True) is table_schema_nested
+
+
+def test_prune_columns_select_nothing(table_schema_nested: Schema) -> None:
+    pruned = prune_columns(table_schema_nested, set(), True)
+    assert pruned.fields == ()
+    assert pruned.schema_id == table_schema_nested.schema_id
+    assert pruned.identifier_field_ids == []
+
+
 def test_schema_select(table_schema_nested: Schema) -> None:
     assert table_schema_nested.select("bar", "baz") == Schema(
         NestedField(field_id=2, name="bar", field_type=IntegerType(), required=True),
@@ -830,6 +934,43 @@ def test_schema_select(table_schema_nested: Schema) -> None:
     )
 
 
+def test_schema_select_is_cached(table_schema_nested: Schema) -> None:
+    selected = table_schema_nested.select("bar", "baz")
+    assert table_schema_nested.select("bar", "baz") is selected
+    assert table_schema_nested.select("BAR", "BAZ", case_sensitive=False) == selected
+
+
+def test_schema_select_cache_not_copied_or_pickled(table_schema_nested: Schema) -> None:
+    selected = table_schema_nested.select("bar")
+    bar = NestedField(field_id=2, name="bar", field_type=LongType(), required=True)
+    copied = table_schema_nested.model_copy(update={"fields": (bar,)})
+    assert copied.select("bar") == Schema(bar, schema_id=1, identifier_field_ids=[2])
+
+    assert "_lazy_selections" not in table_schema_nested.__getstate__()["__dict__"]
+    assert pickle.loads(pickle.dumps(table_schema_nested)).select("bar") == selected
+
+
+def test_schema_as_struct_is_cached(table_schema_nested: Schema) -> None:
+    struct = table_schema_nested.as_struct()
+    assert table_schema_nested.as_struct() is struct
+    assert struct == StructType(*table_schema_nested.fields)
+
+
+def test_schema_equality(table_schema_nested: Schema) -> None:
+    assert table_schema_nested == table_schema_nested
+    assert table_schema_nested == Schema(*table_schema_nested.fields, identifier_field_ids=[2], schema_id=2)
+    assert table_schema_nested != Schema(*table_schema_nested.fields[:-1], identifier_field_ids=[2])
+    last = table_schema_nested.fields[-1]
+    renamed_last = NestedField(last.field_id, "renamed", last.field_type, last.required)
+    assert table_schema_nested != Schema(*table_schema_nested.fields[:-1], renamed_last, identifier_field_ids=[2])
+    assert table_schema_nested != Schema(*table_schema_nested.fields)
+
+    fields = table_schema_nested.fields[:-1]
+    # Fill the cached struct, which must not be carried over to the copy
+    table_schema_nested.as_struct()
+    assert table_schema_nested.model_copy(update={"fields": fields}) == Schema(*fields, identifier_field_ids=[2])
+
+
 def test_schema_select_case_insensitive(table_schema_nested: Schema) -> None:
     assert table_schema_nested.select("BAZ", case_sensitive=False) == Schema(
         NestedField(field_id=3, name="baz", field_type=BooleanType(), required=False), schema_id=1, identifier_field_ids=[]
@@ -842,164 +983,156 @@ def test_schema_select_cant_be_found(table_schema_nested: Schema) -> None:
     assert "Could not find column: 'BAZ'" in str(exc_info.value)
 
 
+PROMOTABLE_TYPES = {
+    (IntegerType, LongType),
+    (FloatType, DoubleType),
+    (StringType, BinaryType),
+    (BinaryType, StringType),
+}
+
+
 def should_promote(file_type: IcebergType, read_type: IcebergType) -> bool:
-    if isinstance(file_type, IntegerType) and isinstance(read_type, LongType):
-        return True
-    if isinstance(file_type, FloatType) and isinstance(read_type, DoubleType):
-        return True
-    if isinstance(file_type, StringType) and isinstance(read_type, BinaryType):
-        return True
-    if isinstance(file_type, BinaryType) and isinstance(read_type, StringType):
+    if (type(file_type), type(read_type)) in PROMOTABLE_TYPES:
         return True
     if isinstance(file_type, DecimalType) and isinstance(read_type, DecimalType):
-        return file_type.precision <= read_type.precision and file_type.scale == file_type.scale
+        return file_type.precision <= read_type.precision and file_type.scale == read_type.scale
     if isinstance(file_type, FixedType) and isinstance(read_type, UUIDType) and len(file_type) == 16:
         return True
     return False
 
 
 def test_identifier_fields_fails(table_schema_nested_with_struct_key_map: Schema) -> None:
-    with pytest.raises(ValueError) as exc_info:
-        Schema(*table_schema_nested_with_struct_key_map.fields, schema_id=1, identifier_field_ids=[999])
-    assert "Could not find field with id: 999" in str(exc_info.value)
+    fields = table_schema_nested_with_struct_key_map.fields
+    location = table_schema_nested_with_struct_key_map.find_field("location")
+    points = table_schema_nested_with_struct_key_map.find_field("points")
+    person = table_schema_nested_with_struct_key_map.find_field("person")
 
-    with pytest.raises(ValueError) as exc_info:
-        Schema(*table_schema_nested_with_struct_key_map.fields, schema_id=1, identifier_field_ids=[11])
-    assert "Identifier field 11 invalid: not a primitive type field" in str(exc_info.value)
+    with pytest.raises(ValueError, match="Could not find field with id: 999"):
+        Schema(*fields, schema_id=1, identifier_field_ids=[999])
 
-    with pytest.raises(ValueError) as exc_info:
-        Schema(*table_schema_nested_with_struct_key_map.fields, schema_id=1, identifier_field_ids=[3])
-    assert "Identifier field 3 invalid: not a required field" in str(exc_info.value)
+    with pytest.raises(ValueError, match="Identifier field 11 invalid: not a primitive type field"):
+        Schema(*fields, schema_id=1, identifier_field_ids=[11])
 
-    with pytest.raises(ValueError) as exc_info:
-        Schema(*table_schema_nested_with_struct_key_map.fields, schema_id=1, identifier_field_ids=[28])
-    assert "Identifier field 28 invalid: must not be float or double field" in str(exc_info.value)
+    with pytest.raises(ValueError, match="Identifier field 3 invalid: not a required field"):
+        Schema(*fields, schema_id=1, identifier_field_ids=[3])
 
-    with pytest.raises(ValueError) as exc_info:
-        Schema(*table_schema_nested_with_struct_key_map.fields, schema_id=1, identifier_field_ids=[29])
-    assert "Identifier field 29 invalid: must not be float or double field" in str(exc_info.value)
+    with pytest.raises(ValueError, match="Identifier field 28 invalid: must not be float or double field"):
+        Schema(*fields, schema_id=1, identifier_field_ids=[28])
 
-    with pytest.raises(ValueError) as exc_info:
-        Schema(*table_schema_nested_with_struct_key_map.fields, schema_id=1, identifier_field_ids=[23])
-    assert (
-        f"Cannot add field zip as an identifier field: must not be nested in {table_schema_nested_with_struct_key_map.find_field('location')}"
-        in str(exc_info.value)
-    )
+    with pytest.raises(ValueError, match="Identifier field 29 invalid: must not be float or double field"):
+        Schema(*fields, schema_id=1, identifier_field_ids=[29])
 
-    with pytest.raises(ValueError) as exc_info:
-        Schema(*table_schema_nested_with_struct_key_map.fields, schema_id=1, identifier_field_ids=[26])
-    assert (
-        f"Cannot add field x as an identifier field: must not be nested in {table_schema_nested_with_struct_key_map.find_field('points')}"
-        in str(exc_info.value)
-    )
+    with pytest.raises(
+        ValueError, match=re.escape(f"Cannot add field zip as an identifier field: must not be nested in {location}")
+    ):
+        Schema(*fields, schema_id=1, identifier_field_ids=[23])
 
-    with pytest.raises(ValueError) as exc_info:
-        Schema(*table_schema_nested_with_struct_key_map.fields, schema_id=1, identifier_field_ids=[17])
-    assert (
-        f"Cannot add field age as an identifier field: must not be nested in an optional field {table_schema_nested_with_struct_key_map.find_field('person')}"
-        in str(exc_info.value)
-    )
+    with pytest.raises(ValueError, match=re.escape(f"Cannot add field x as an identifier field: must not be nested in {points}")):
+        Schema(*fields, schema_id=1, identifier_field_ids=[26])
 
+    with pytest.raises(
+        ValueError,
+        match=re.escape(f"Cannot add field age as an identifier field: must not be nested in an optional field {person}"),
+    ):
+        Schema(*fields, schema_id=1, identifier_field_ids=[17])
 
-@pytest.mark.parametrize(
-    "file_type",
-    TEST_PRIMITIVE_TYPES,
-)
-@pytest.mark.parametrize(
-    "read_type",
-    TEST_PRIMITIVE_TYPES,
-)
+
+# Every pair of different types, split on whether the file type promotes to the read type
+PROMOTIONS = [
+    (file_type, read_type) for file_type in TEST_PRIMITIVE_TYPES for read_type in TEST_PRIMITIVE_TYPES if file_type != read_type
+]
+VALID_PROMOTIONS = [pair for pair in PROMOTIONS if should_promote(*pair)]
+INVALID_PROMOTIONS = [pair for pair in PROMOTIONS if not should_promote(*pair)]
+
+
+@pytest.mark.parametrize("file_type, read_type", VALID_PROMOTIONS, ids=str)
 def test_promotion(file_type: IcebergType, read_type: IcebergType) -> None:
-    if file_type == read_type:
-        return
-    if should_promote(file_type, read_type):
-        assert promote(file_type, read_type) == read_type
-    else:
-        with pytest.raises(ResolveError):
-            promote(file_type, read_type)
+    assert promote(file_type, read_type) == read_type
+
+
+@pytest.mark.parametrize("file_type, read_type", INVALID_PROMOTIONS, ids=str)
+def test_no_promotion(file_type: IcebergType, read_type: IcebergType) -> None:
+    with pytest.raises(ResolveError):
+        promote(file_type, read_type)
+
+
+def test_promote_decimal_keeps_scale() -> None:
+    assert promote(DecimalType(10, 2), DecimalType(12, 2)) == DecimalType(12, 2)
+    with pytest.raises(ResolveError, match=r"Cannot change scale from decimal\(10, 2\) to decimal\(12, 3\)"):
+        promote(DecimalType(10, 2), DecimalType(12, 3))
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def primitive_fields() -> List[NestedField]:
-    return [
-        NestedField(field_id=1, name=str(primitive_type), field_type=primitive_type, required=False)
-        for primitive_type in TEST_PRIMITIVE_TYPES
-    ]
-
-
-def test_add_top_level_primitives(primitive_fields: List[NestedField]) -> None:
-    for primitive_field in primitive_fields:
-        new_schema = Schema(primitive_field)
-        applied = UpdateSchema(transaction=None, schema=Schema()).union_by_name(new_schema)._apply()  # type: ignore
-        assert applied == new_schema
-
-
-def test_add_top_level_list_of_primitives(primitive_fields: NestedField) -> None:
-    for primitive_type in TEST_PRIMITIVE_TYPES:
-        new_schema = Schema(
-            NestedField(
-                field_id=1,
-                name="aList",
-                field_type=ListType(element_id=2, element_type=primitive_type, element_required=False),
-                required=False,
-            )
-        )
-        applied = UpdateSchema(transaction=None, schema=Schema()).union_by_name(new_schema)._apply()  # type: ignore
-        assert applied.as_struct() == new_schema.as_struct()
-
-
-def test_add_top_level_map_of_primitives(primitive_fields: NestedField) -> None:
-    for primitive_type in TEST_PRIMITIVE_TYPES:
-        new_schema = Schema(
-            NestedField(
-                field_id=1,
-                name="aMap",
-                field_type=MapType(
-                    key_id=2, key_type=primitive_type, value_id=3, value_type=primitive_type, value_required=False
-                ),
-                required=False,
-            )
+    return [_primitive_field(1, primitive_type) for primitive_type in TEST_PRIMITIVE_TYPES]
+
+
+@pytest.mark.parametrize("primitive_type", TEST_PRIMITIVE_TYPES, ids=str)
+def test_add_top_level_primitives(primitive_type: PrimitiveType) -> None:
+    new_schema = Schema(_primitive_field(1, primitive_type))
+    applied = UpdateSchema(transaction=None, schema=Schema()).union_by_name(new_schema)._apply()  # type: ignore
+    assert applied == new_schema
+
+
+@pytest.mark.parametrize("primitive_type", TEST_PRIMITIVE_TYPES, ids=str)
+def test_add_top_level_list_of_primitives(primitive_type: PrimitiveType) -> None:
+    new_schema = Schema(
+        NestedField(
+            field_id=1,
+            name="aList",
+            field_type=ListType(element_id=2, element_type=primitive_type, element_required=False),
+            required=False,
         )
-        applied = UpdateSchema(transaction=None, schema=Schema()).union_by_name(new_schema)._apply()  # type: ignore
-        assert applied.as_struct() == new_schema.as_struct()
-
-
-def test_add_top_struct_of_primitives(primitive_fields: NestedField) -> None:
-    for primitive_type in TEST_PRIMITIVE_TYPES:
-        new_schema = Schema(
-            NestedField(
-                field_id=1,
-                name="aStruct",
-                field_type=StructType(NestedField(field_id=2, name="primitive", field_type=primitive_type, required=False)),
-                required=False,
-            )
+    )
+    applied = UpdateSchema(transaction=None, schema=Schema()).union_by_name(new_schema)._apply()  # type: ignore
+    assert applied == new_schema
+
+
+@pytest.mark.parametrize("primitive_type", TEST_PRIMITIVE_TYPES, ids=str)
+def test_add_top_level_map_of_primitives(primitive_type: PrimitiveType) -> None:
+    new_schema = Schema(
+        NestedField(
+            field_id=1,
+            name="aMap",
+            field_type=MapType(key_id=2, key_type=primitive_type, value_id=3, value_type=primitive_type, value_required=False),
+            required=False,
         )
-        applied = UpdateSchema(transaction=None, schema=Schema()).union_by_name(new_schema)._apply()  # type: ignore
-        assert applied.as_struct() == new_schema.as_struct()
-
-
-def test_add_nested_primitive(primitive_fields: NestedField) -> None:
-    for primitive_type in TEST_PRIMITIVE_TYPES:
-        current_schema = Schema(NestedField(field_id=1, name="aStruct", field_type=StructType(), required=False))
-        new_schema = Schema(
-            NestedField(
-                field_id=1,
-                name="aStruct",
-                field_type=StructType(NestedField(field_id=2, name="primitive", field_type=primitive_type, required=False)),
-                required=False,
-            )
+    )
+    applied = UpdateSchema(transaction=None, schema=Schema()).union_by_name(new_schema)._apply()  # type: ignore
+    assert applied == new_schema
+
+
+@pytest.mark.parametrize("primitive_type", TEST_PRIMITIVE_TYPES, ids=str)
+def test_add_top_struct_of_primitives(primitive_type: PrimitiveType) -> None:
+    new_schema = Schema(
+        NestedField(
+            field_id=1,
+            name="aStruct",
+            field_type=StructType(NestedField(field_id=2, name="primitive", field_type=primitive_type, required=False)),
+            required=False,
         )
-        applied = UpdateSchema(None, None, schema=current_schema).union_by_name(new_schema)._apply()  # type: ignore
-        assert applied.as_struct() == new_schema.as_struct()
+    )
+    applied = UpdateSchema(transaction=None, schema=Schema()).union_by_name(new_schema)._apply()  # type: ignore
+    assert applied == new_schema
 
 
-def _primitive_fields(types: List[PrimitiveType], start_id: int = 0) -> List[NestedField]:
-    fields = []
-    for iceberg_type in types:
-        fields.append(NestedField(field_id=start_id, name=str(iceberg_type), field_type=iceberg_type, required=False))
-        start_id = start_id + 1
+@pytest.mark.parametrize("primitive_type", TEST_PRIMITIVE_TYPES, ids=str)
+def test_add_nested_primitive(primitive_type: PrimitiveType) -> None:
+    current_schema = Schema(NestedField(field_id=1, name="aStruct", field_type=StructType(), required=False))
+    new_schema = Schema(
+        NestedField(
+            field_id=1,
+            name="aStruct",
+            field_type=StructType(NestedField(field_id=2, name="primitive", field_type=primitive_type, required=False)),
+            required=False,
+        )
+    )
+    applied = UpdateSchema(None, None, schema=current_schema).union_by_name(new_schema)._apply()  # type: ignore
+    assert applied == new_schema
+
 
-    return fields
+def _primitive_fields(types: Tuple[PrimitiveType, ...], start_id: int = 0) -> List[NestedField]:
+    return [_primitive_field(field_id, iceberg_type) for field_id, iceberg_type in enumerate(types, start_id)]
 
 
 def test_add_nested_primitives(primitive_fields: NestedField) -> None:
@@ -1010,7 +1143,7 @@ def test_add_nested_primitives(primitive_fields: NestedField) -> None:
         )
     )
     applied = UpdateSchema(transaction=None, schema=current_schema).union_by_name(new_schema)._apply()  # type: ignore
-    assert applied.as_struct() == new_schema.as_struct()
+    assert applied == new_schema
 
 
 def test_add_nested_lists(primitive_fields: NestedField) -> None:
@@ -1051,7 +1184,7 @@ def test_add_nested_lists(primitive_fields: NestedField) -> None:
         )
     )
     applied = UpdateSchema(transaction=None, schema=Schema()).union_by_name(new_schema)._apply()  # type: ignore
-    assert applied.as_struct() == new_schema.as_struct()
+    assert applied == new_schema
 
 
 def test_add_nested_struct(primitive_fields: NestedField) -> None:
@@ -1101,7 +1234,7 @@ def test_add_nested_struct(primitive_fields: NestedField) -> None:
         )
     )
     applied = UpdateSchema(transaction=None, schema=Schema()).union_by_name(new_schema)._apply()  # type: ignore
-    assert applied.as_struct() == new_schema.as_struct()
+    assert applied == new_schema
 
 
 def test_add_nested_maps(primitive_fields: NestedField) -> None:
@@ -1144,7 +1277,7 @@ def test_add_nested_maps(primitive_fields: NestedField) -> None:
         )
     )
     applied = UpdateSchema(transaction=None, schema=Schema()).union_by_name(new_schema)._apply()  # type: ignore
-    assert applied.as_struct() == new_schema.as_struct()
+    assert applied == new_schema
 
 
 def test_detect_invalid_top_level_list() -> None:
@@ -1197,7 +1330,7 @@ def test_allow_double_to_float() -> None:
 
     applied = UpdateSchema(transaction=None, schema=current_schema).union_by_name(new_schema)._apply()  # type: ignore
 
-    assert applied.as_struct() == current_schema.as_struct()
+    assert applied == current_schema
     assert len(applied.fields) == 1
     assert isinstance(applied.fields[0].field_type, DoubleType)
 
@@ -1208,7 +1341,7 @@ def test_promote_float_to_double() -> None:
 
     applied = UpdateSchema(transaction=None, schema=current_schema).union_by_name(new_schema)._apply()  # type: ignore
 
-    assert applied.as_struct() == new_schema.as_struct()
+    assert applied == new_schema
     assert len(applied.fields) == 1
     assert isinstance(applied.fields[0].field_type, DoubleType)
 
@@ -1219,7 +1352,7 @@ def test_allow_long_to_int() -> None:
 
     applied = UpdateSchema(transaction=None, schema=current_schema).union_by_name(new_schema)._apply()  # type: ignore
 
-    assert applied.as_struct() == current_schema.as_struct()
+    assert applied == current_schema
     assert len(applied.fields) == 1
     assert isinstance(applied.fields[0].field_type, LongType)
 
@@ -1230,7 +1363,7 @@ def test_promote_int_to_long() -> None:
 
     applied = UpdateSchema(transaction=None, schema=current_schema).union_by_name(new_schema)._apply()  # type: ignore
 
-    assert applied.as_struct() == new_schema.as_struct()
+    assert applied == new_schema
     assert len(applied.fields) == 1
     assert isinstance(applied.fields[0].field_type, LongType)
 
@@ -1251,7 +1384,7 @@ def test_type_promote_decimal_to_fixed_scale_with_wider_precision() -> None:
 
     applied = UpdateSchema(transaction=None, schema=current_schema).union_by_name(new_schema)._apply()  # type: ignore
 
-    assert applied.as_struct() == new_schema.as_struct()
+    assert applied == new_schema
     assert len(applied.fields) == 1
     field = applied.fields[0]
     decimal_type = field.field_type
@@ -1349,7 +1482,7 @@ def test_add_nested_structs(primitive_fields: NestedField) -> None:
         )
     )
 
-    assert applied.as_struct() == expected.as_struct()
+    assert applied == expected
 
 
 def test_replace_list_with_primitive() -> None:
@@ -1360,6 +1493,13 @@ def test_replace_list_with_primitive() -> None:
         _ = UpdateSchema(transaction=None, schema=current_schema).union_by_name(new_schema)._apply()  # type: ignore
 
 
+def test_union_with_same_schema(table_schema_nested: Schema) -> None:
+    update = UpdateSchema(transaction=None, schema=table_schema_nested).union_by_name(table_schema_nested)  # type: ignore
+    applied = update._apply()
+    assert applied == table_schema_nested
+    assert applied.fields == table_schema_nested.fields
+
+
 def test_mirrored_schemas() -> None:
     current_schema = Schema(
         NestedField(9, "struct1", StructType(NestedField(8, "string1", StringType(), required=False)), required=False),
@@ -1382,7 +1522,7 @@ def test_mirrored_schemas() -> None:
 
     applied = UpdateSchema(transaction=None, schema=current_schema).union_by_name(mirrored_schema)._apply()  # type: ignore
 
-    assert applied.as_struct() == current_schema.as_struct()
+    assert applied == current_schema
 
 
 def test_add_new_top_level_struct() -> None:
@@ -1434,7 +1574,7 @@ def test_add_new_top_level_struct() -> None:
 
     applied = UpdateSchema(transaction=None, schema=current_schema).union_by_name(observed_schema)._apply()  # type: ignore
 
-    assert applied.as_struct() == observed_schema.as_struct()
+    assert applied == observed_schema
 
 
 def test_append_nested_struct() -> None:
@@ -1513,7 +1653,7 @@ def test_append_nested_struct() -> None:
 
     applied = UpdateSchema(transaction=None, schema=current_schema).union_by_name(observed_schema)._apply()  # type: ignore
 
-    assert applied.as_struct() == observed_schema.as_struct()
+    assert applied == observed_schema
 
 
 def test_append_nested_lists() -> None:
@@ -1614,10 +1754,21 @@ def test_append_nested_lists() -> None:
         )
     )
 
-    assert union.as_struct() == expected.as_struct()
+    assert union == expected
 
 
-def test_union_with_pa_schema(primitive_fields: NestedField) -> None:
+@pytest.fixture(scope="module")
+def foo_bar_baz_schema() -> Schema:
+    return Schema(
+        NestedField(field_id=1, name="foo", field_type=StringType(), required=True),
+        NestedField(field_id=2, name="bar", field_type=IntegerType(), required=False),
+        NestedField(field_id=3, name="baz", field_type=BooleanType(), required=False),
+    )
+
+
+def test_union_with_pa_schema(primitive_fields: NestedField, foo_bar_baz_schema: Schema) -> None:
+    import pyarrow as pa
+
     base_schema = Schema(NestedField(field_id=1, name="foo", field_type=StringType(), required=True))
 
     pa_schema = pa.schema(
@@ -1630,21 +1781,11 @@ def test_union_with_pa_schema(primitive_fields: NestedField) -> None:
 
     new_schema = UpdateSchema(transaction=None, schema=base_schema).union_by_name(pa_schema)._apply()  # type: ignore
 
-    expected_schema = Schema(
-        NestedField(field_id=1, name="foo", field_type=StringType(), required=True),
-        NestedField(field_id=2, name="bar", field_type=IntegerType(), required=False),
-        NestedField(field_id=3, name="baz", field_type=BooleanType(), required=False),
-    )
-
-    assert new_schema == expected_schema
+    assert new_schema == foo_bar_baz_schema
 
 
-def test_arrow_schema() -> None:
-    base_schema = Schema(
-        NestedField(field_id=1, name="foo", field_type=StringType(), required=True),
-        NestedField(field_id=2, name="bar", field_type=IntegerType(), required=False),
-        NestedField(field_id=3, name="baz", field_type=BooleanType(), required=False),
-    )
+def test_arrow_schema(foo_bar_baz_schema: Schema) -> None:
+    import pyarrow as pa
 
     expected_schema = pa.schema(
         [
@@ -1654,4 +1795,5 @@ def test_arrow_schema() -> None:
         ]
     )
 
-    assert base_schema.as_arrow() == expected_schema
+    assert foo_bar_baz_schema.as_arrow() == expected_schema
+    assert foo_bar_baz_schema.as_arrow() is foo_bar_baz_schema.as_arrow()
@@ -16,7 +16,7 @@
 # under the License.
 # pylint: disable=W0123,W0613
 import pickle
-from typing import Type
+from typing import Any, Type
 
 import pydantic_core
 import pytest
@@ -178,6 +178,16 @@ def test_struct_field_by_name() -> None:
     assert type_var.field_by_name("nonexistent_field", case_sensitive=True) is None
 
 
+def test_struct_field() -> None:
+    first_field = NestedField(1, "first_field", IntegerType(), required=True)
+    second_field = NestedField(2, "second_field", StringType(), required=False)
+    type_var = StructType(first_field, second_field)
+
+    assert type_var.field(1) == first_field
+    assert type_var.field(2) == second_field
+    assert type_var.field(3) is None
+
+
 def test_list_type() -> None:
     type_var = ListType(
         1,
@@ -244,6 +254,114 @@ def test_nested_field() -> None:
         _ = (NestedField(1, "field", StringType(), required=True, write_default=(1, "a", True)),)  # type: ignore
 
 
+def test_nested_field_interned() -> None:
+    def deserialize(**values: Any) -> NestedField:
+        return NestedField.model_validate({"id": 1, "name": "field", "type": "string", "required": True, **values})
+
+    field_var = deserialize()
+    assert field_var is deserialize()
+    assert field_var is not deserialize(required=False)
+    assert deserialize(doc="doc") is deserialize(doc="doc")
+    assert field_var == NestedField(1, "field", StringType(), required=True)
+
+    # Fields that are created in code, or that have a default value or a nested type, are always created
+    assert NestedField(1, "field", StringType(), required=True) is not NestedField(1, "field", StringType(), required=True)
+    assert deserialize(**{"initial-default": "a"}) is not deserialize(**{"initial-default": "a"})
+    struct_type = {"type": "struct", "fields": [{"id": 2, "name": "x", "type": "long", "required": False}]}
+    assert deserialize(type=struct_type) is not deserialize(type=struct_type)
+
+    assert field_var == pickle.loads(pickle.dumps(field_var))
+
+
+def test_nested_field_unhashable_arguments_fail_validation() -> None:
+    with pytest.raises(pydantic_core.ValidationError):
+        NestedField(1, "field", StringType(), doc=["doc"])  # type: ignore
+    with pytest.raises(pydantic_core.ValidationError):
+        NestedField.model_validate({"id": 1, "name": "field", "type": "string", "required": False, "doc": ["doc"]})
+
+
+def test_nested_field_equality_and_hash() -> None:
+    list_type = ListType(element_id=2, element_type=StringType(), element_required=False)
+    field_var = NestedField(1, "field", list_type, doc="doc")
+    same_field = NestedField(1, "field", ListType(element_id=2, element_type=StringType(), element_required=False), doc="doc")
+    assert field_var == same_field
+    assert hash(field_var) == hash(same_field)
+    assert field_var != NestedField(1, "field", list_type, doc="other doc")
+    assert NestedField(1, "field", StringType(), initial_default="a") != NestedField(
+        1, "field", StringType(), initial_default="b"
+    )
+    assert field_var != list_type
+
+
+def test_nested_field_copy_with_update() -> None:
+    field_var = NestedField(1, "field", StringType(), doc="doc")
+    assert hash(field_var) == hash(NestedField(1, "field", StringType(), doc="doc"))
+
+    renamed = field_var.model_copy(update={"name": "renamed"})
+    assert renamed != field_var
+    assert renamed == NestedField(1, "renamed", StringType(), doc="doc")
+    assert hash(renamed) == hash(NestedField(1, "renamed", StringType(), doc="doc"))
+    assert field_var.model_copy(update={"doc": "other"}, deep=True) == NestedField(1, "field", StringType(), doc="other")
+
+
+def test_nested_type_hash_is_structural() -> None:
+    def nested_type(value_id: int) -> MapType:
+        return MapType(
+            key_id=1,
+            key_type=StringType(),
+            value_id=value_id,
+            value_type=ListType(element_id=3, element_type=StructType(NestedField(4, "field", IntegerType()))),
+        )
+
+    assert nested_type(2) == nested_type(2)
+    assert hash(nested_type(2)) == hash(nested_type(2))
+    assert nested_type(2) != nested_type(5)
+
+
+def test_struct_type_equality() -> None:
+    def struct(last_name: str) -> StructType:
+        return StructType(
+            NestedField(1, "point", StructType(NestedField(2, "x", FloatType()), NestedField(3, "y", FloatType()))),
+            NestedField(4, last_name, StringType()),
+        )
+
+    assert struct("name") == struct("name")
+    assert struct("name") != struct("other")
+    assert struct("name") != NestedField(4, "name", StringType())
+
+
+def test_struct_type_copy_with_update() -> None:
+    struct = StructType(NestedField(1, "a", StringType()), NestedField(2, "b", LongType()))
+    assert hash(struct) == hash(StructType(*struct.fields))
+    assert struct.field_by_name("a") is not None
+
+    new_fields = (NestedField(1, "a", StringType()), NestedField(3, "c", DoubleType()))
+    copied = struct.model_copy(update={"fields": new_fields})
+    assert copied == StructType(*new_fields)
+    assert copied != struct
+    assert hash(copied) == hash(StructType(*new_fields))
+    assert copied.field(3) == new_fields[1]
+    assert copied.field(2) is None
+    assert copied.field_by_name("c") == new_fields[1]
+    assert copied.field_by_name("B", case_sensitive=False) is None
+
+
+def test_nested_type_copy_with_update() -> None:
+    list_type = ListType(element_id=1, element_type=StringType())
+    assert hash(list_type) == hash(ListType(element_id=1, element_type=StringType()))
+    copied_list = list_type.model_copy(update={"element_type": LongType()})
+    assert copied_list == ListType(element_id=1, element_type=LongType())
+    assert copied_list in {ListType(element_id=1, element_type=LongType())}
+    assert copied_list.element_field == NestedField(1, "element", LongType(), required=True)
+
+    map_type = MapType(key_id=1, key_type=StringType(), value_id=2, value_type=IntegerType())
+    assert hash(map_type) == hash(MapType(key_id=1, key_type=StringType(), value_id=2, value_type=IntegerType()))
+    copied_map = map_type.model_copy(update={"value_type": LongType()})
+    assert copied_map == MapType(key_id=1, key_type=StringType(), value_id=2, value_type=LongType())
+    assert copied_map in {MapType(key_id=1, key_type=StringType(), value_id=2, value_type=LongType())}
+    assert copied_map.value_field.field_type == LongType()
+
+
 def test_nested_field_complex_type_as_str_unsupported() -> None:
     unsupported_types = ["list", "map", "struct"]
     for type_str in unsupported_types:
@@ -281,6 +399,17 @@ def test_non_parameterized_type_equality(
         assert input_type() != check_type()
 
 
+def test_primitive_type_equality_and_hash() -> None:
+    assert IntegerType() is IntegerType()
+    assert FixedType(8) is not FixedType(length=8)
+    assert FixedType(8) == FixedType(length=8)
+    assert hash(FixedType(8)) == hash(FixedType(length=8))
+    assert FixedType(8) != FixedType(16)
+    assert IntegerType() != LongType()
+    assert IntegerType() != "int"
+    assert {IntegerType(): 1}[IntegerType()] == 1
+
+
 # Examples based on https://iceberg.apache.org/spec/#appendix-c-json-serialization
 def test_serialization_boolean() -> None:
     assert BooleanType().model_dump_json() == '"boolean"'